@@ -4,22 +4,43 @@ GitHub Profile SVG Generator
 Generates neofetch-style profile SVGs with statistics using GitHub GraphQL API
 """
 
-import argparse
+import functools
+import itertools
+import json
 import os
 import re
+import sys
+import time
+import types
 import unicodedata
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # SVG Configuration Constants
 SVG_WIDTH = 1024
 SVG_HEIGHT = None  # Will be calculated dynamically based on content
 ASCII_HEIGHT = 490  # Height of ASCII art section, modify based on the art added
 
+# Response cache configuration
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'andrew6rant')
+USER_INFO_CACHE_TTL = 3600  # Seconds before the cached basic user info is fetched again
+
+# Character classes used when measuring display names
+INVISIBLE_CATEGORIES = frozenset({'Cf', 'Mn', 'Me'})  # Format chars, nonspacing marks, enclosing marks
+INVISIBLE_CHARS = frozenset({'\u200b', '\u200c', '\u200d', '\u2060', '\ufeff',
+                             '\u202a', '\u202b', '\u202c', '\u202d', '\u202e'})
+WIDE_WIDTHS = frozenset({'F', 'W'})  # Fullwidth or Wide
+
+# Padding strings for every length a 75 character line can need
+DASH_PADS = {i: '—' * i for i in range(80)}
+DOT_PADS = {i: '.' * i for i in range(80)}
+
 # GitHub language colors (subset - add more as needed)
-LANGUAGE_COLORS = {
+LANGUAGE_COLORS = types.MappingProxyType({
     'Python': '#3572A5',
     'JavaScript': '#f1e05a',
     'TypeScript': '#2b7489',
@@ -84,7 +105,84 @@ LANGUAGE_COLORS = {
     'Ada': '#02f88c',
     'Fortran': '#4d41b1',
     'COBOL': '#005590'
-}
+})
+
+
+# Static part of the profile content, following the Bio and Uptime lines (see get_profile_content_definition)
+PROFILE_STATIC_CONTENT = (
+    # System info section
+    ("OS", "macOS 26 Tahoe, Windows 11, Fedora 42"),
+    ("Editors", "NeoVim, Visual Studio Code"),
+    ("IDE", "Xcode, IntelliJ IDEA"),
+
+    # Add gap before languages section
+    ("GAP", ""),
+
+    # Languages section
+    ("Languages.Programming", "Kotlin, Java, Python, Rust, Shell"),
+    ("Languages.Markup", "HTML, CSS, Markdown, Typst, LaTeX"),
+    ("Languages.Real", "Chinese, English, French"),
+
+    # Add gap and Contact section header
+    ("GAP", ""),
+    ("— Contact ", ""),
+
+    # Contact info
+    ("Email.Contact", "me@cubik65536.top"),
+    ("Email.Alternative", "cubik65536@cubik65536.top"),
+    ("Email.Alternative", "cubik65536@proton.me"),
+    ("LinkedIn", "in/qianq"),
+    ("Discord", "Cubik65536"),
+
+    # Add gap and GitHub Statistics section header
+    ("GAP", ""),
+    ("— GitHub Statistics ", ""),
+
+    # GitHub Statistics (values will be replaced during rendering)
+    ("Repository", "PLACEHOLDER"),  # repos, contributed repos, stars, followers
+    ("Commits", "PLACEHOLDER"),  # commits, code line changes
+    ("Issues", "PLACEHOLDER"),  # open/closed issues
+    ("Pull Requests", "PLACEHOLDER"),  # open/draft/merged/closed PRs
+)
+
+
+# One line of the main text column (header, content lines and language details)
+TEXT_ROW = '\n<text x="{x}" y="{y}" fill="{fill}" font-size="14px"><tspan x="{x}" y="{y}">{line}</tspan></text>'
+
+# ASCII art block of the profile, rendered by render_ascii_art()
+ASCII_X = 25
+ASCII_ART_TEMPLATE = '''
+<text x="{x}" y="30" fill="{text_color}" class="ascii">
+    <tspan x="{x}" y="50">                  @</tspan>
+    <tspan x="{x}" y="70">              @@    @@</tspan>
+    <tspan x="{x}" y="90">           @@@        @@@</tspan>
+    <tspan x="{x}" y="110">        @-     @@  @@      @</tspan>
+    <tspan x="{x}" y="130">     @ @#       @@@@       @@ @</tspan>
+    <tspan x="{x}" y="150">  %      +@@ @@      @@ @@+      @</tspan>
+    <tspan x="{x}" y="170">*@@      :@@ @@      @@ @@+      @@*</tspan>
+    <tspan x="{x}" y="190">%<tspan class="green">-</tspan>#@@@%@-       @@@@       .@#@@##<tspan class="red">=</tspan>%</tspan>
+    <tspan x="{x}" y="210">@<tspan class="green">=**+-</tspan>@@@:    #@@  @@.    -@%@<tspan class="red">*+++=</tspan>%</tspan>
+    <tspan x="{x}" y="230">@<tspan class="green">*-=+-</tspan>@<tspan class="green">:*</tspan>@@@@@        @@@@##<tspan class="red">-</tspan>@<tspan class="red">=+==+</tspan>@</tspan>
+    <tspan x="{x}" y="250">@<tspan class="green">-</tspan>@@@<tspan class="green">:</tspan>@<tspan class="green">:**=-</tspan>@<tspan class="green">*</tspan>@@    @@#@<tspan class="red">+=++-</tspan>@<tspan class="red">=</tspan>#@@<tspan class="red">=</tspan>%</tspan>
+    <tspan x="{x}" y="270">@<tspan class="green">--==</tspan>@@@<tspan class="green">=---</tspan>@<tspan class="green">:+%</tspan>@@@%#<tspan class="red">+-</tspan>@<tspan class="red">+===</tspan>#@@<tspan class="red">+===</tspan>@</tspan>
+    <tspan x="{x}" y="290">@<tspan class="green">-=**:</tspan>@<tspan class="green">:</tspan>@@@<tspan class="green">-</tspan>@<tspan class="green">:**=</tspan>%%<tspan class="red">=*+=</tspan>@<tspan class="red">+</tspan>@@@<tspan class="red">-</tspan>@<tspan class="red">=+++=</tspan>%</tspan>
+    <tspan x="{x}" y="310">@@<tspan class="green">%=-:</tspan>@<tspan class="green">:=--*</tspan>@@<tspan class="green">*-:</tspan>##<tspan class="red">-=+</tspan>@@#<tspan class="red">==+-</tspan>@<tspan class="red">-=+#</tspan>@%</tspan>
+    <tspan x="{x}" y="330">@<tspan class="green">-=</tspan>@@#@<tspan class="green">:=*+=</tspan>@<tspan class="green">:</tspan>#@@@@@@#<tspan class="red">=</tspan>@<tspan class="red">++++-</tspan>@<tspan class="red">*</tspan>@@<tspan class="red">+=</tspan>%</tspan>
+    <tspan x="{x}" y="350">@<tspan class="green">=+=-:</tspan>@@@<tspan class="green">=-:</tspan>@<tspan class="green">:+-:%</tspan>#<tspan class="red">-=+=</tspan>@<tspan class="red">==+</tspan>@@@<tspan class="red">-==+=</tspan>@</tspan>
+    <tspan x="{x}" y="370">@<tspan class="green">++**:</tspan>@<tspan class="green">:-</tspan>@@@@<tspan class="green">:-+=</tspan>@@<tspan class="red">=+=-</tspan>@@@@<tspan class="red">=-</tspan>@<tspan class="red">=++-:</tspan>#</tspan>
+    <tspan x="{x}" y="390"> @@@<tspan class="green">*:</tspan>@<tspan class="green">:+=::</tspan>@@@<tspan class="green">+:</tspan>##<tspan class="red">=+</tspan>@@@<tspan class="red">==++=</tspan>@<tspan class="red">---</tspan>%</tspan>
+    <tspan x="{x}" y="410">    @@@<tspan class="green">=+==-</tspan>@<tspan class="green">.-</tspan>#@@@@#<tspan class="red">=-</tspan>@<tspan class="red">+++-.</tspan>@%</tspan>
+    <tspan x="{x}" y="430">        @@<tspan class="green">=-</tspan>@<tspan class="green">:++:*</tspan>#<tspan class="red">-++=</tspan>@<tspan class="red">=:=</tspan>#</tspan>
+    <tspan x="{x}" y="450">           @@<tspan class="green">-:::%</tspan>@<tspan class="red">==-:</tspan>%%</tspan>
+    <tspan x="{x}" y="470">              @@<tspan class="green">:+</tspan>*<tspan class="red">:%</tspan>@</tspan>
+    <tspan x="{x}" y="490">                  *</tspan>
+</text>'''
+
+
+@functools.lru_cache(maxsize=None)
+def render_ascii_art(text_color):
+    """Render the static ASCII art block once per text color (i.e. once per mode)"""
+    return ASCII_ART_TEMPLATE.format(x=ASCII_X, text_color=text_color)
 
 
 def get_profile_content_definition(user_data):
@@ -115,62 +213,41 @@ def get_profile_content_definition(user_data):
     months = (age.days % 365) // 30
     days = (age.days % 365) % 30
 
-    # Build the content structure
-    content_lines = []
-
-    # Bio section with special formatting
+    # Bio and uptime are the only per-user lines, the rest is shared by reference
     bio_text = user_data.get("bio", "") or ""
-    content_lines.append(("Bio", bio_text))
     # BIO_OVERFLOW will be added dynamically during rendering if needed
-
-    # System info section
-    content_lines.extend([
+    return [
+        ("Bio", bio_text),
         ("Uptime", f"{years} years, {months} months, {days} days"),
-        ("OS", "macOS 26 Tahoe, Windows 11, Fedora 42"),
-        ("Editors", "NeoVim, Visual Studio Code"),
-        ("IDE", "Xcode, IntelliJ IDEA"),
-    ])
+        *PROFILE_STATIC_CONTENT,
+    ]
 
-    # Add gap before languages section
-    content_lines.append(("GAP", ""))
 
-    # Languages section
-    content_lines.extend([
-        ("Languages.Programming", "Kotlin, Java, Python, Rust, Shell"),
-        ("Languages.Markup", "HTML, CSS, Markdown, Typst, LaTeX"),
-        ("Languages.Real", "Chinese, English, French"),
-    ])
+class InvisibleCharTable(dict):
+    """
+    str.translate table that deletes invisible characters.
 
-    # Add gap and Contact section header
-    content_lines.extend([
-        ("GAP", ""),
-        ("— Contact ", ""),
-    ])
+    Code points are classified on first use and remembered, so translating a string
+    only consults unicodedata for characters that have not been seen before.
+    """
 
-    # Contact info
-    content_lines.extend([
-        ("Email.Contact", "me@cubik65536.top"),
-        ("Email.Alternative", "cubik65536@cubik65536.top"),
-        ("Email.Alternative", "cubik65536@proton.me"),
-        ("LinkedIn", "in/qianq"),
-        ("Discord", "Cubik65536"),
-    ])
+    def __init__(self):
+        super().__init__(dict.fromkeys(map(ord, INVISIBLE_CHARS)))
 
-    # Add gap and GitHub Statistics section header
-    content_lines.extend([
-        ("GAP", ""),
-        ("— GitHub Statistics ", ""),
-    ])
+    def __missing__(self, codepoint):
+        # None deletes the character, the code point itself keeps it unchanged
+        value = None if unicodedata.category(chr(codepoint)) in INVISIBLE_CATEGORIES else codepoint
+        self[codepoint] = value
+        return value
+
+
+INVISIBLE_CHAR_TABLE = InvisibleCharTable()
 
-    # GitHub Statistics (values will be replaced during rendering)
-    content_lines.extend([
-        ("Repository", "PLACEHOLDER"),  # repos, contributed repos, stars, followers
-        ("Commits", "PLACEHOLDER"),  # commits, code line changes
-        ("Issues", "PLACEHOLDER"),  # open/closed issues
-        ("Pull Requests", "PLACEHOLDER")  # open/draft/merged/closed PRs
-    ])
 
-    return content_lines
+@functools.lru_cache(maxsize=4096)
+def char_width(char):
+    """Return the display width of a character, 2 for fullwidth or wide characters and 1 otherwise"""
+    return 2 if unicodedata.east_asian_width(char) in WIDE_WIDTHS else 1
 
 
 def clean_and_visible_length(text):
@@ -179,29 +256,28 @@ def clean_and_visible_length(text):
         return text, 0
 
     # Remove or normalize invisible characters
-    cleaned = ''
-    for char in text:
-        # Skip zero-width characters and other invisible characters
-        if unicodedata.category(char) in ['Cf', 'Mn', 'Me']:  # Format chars, nonspacing marks, enclosing marks
-            continue
-        # Skip specific invisible characters
-        if char in ['\u200b', '\u200c', '\u200d', '\u2060', '\ufeff', '\u202a', '\u202b', '\u202c', '\u202d',
-                    '\u202e']:
-            continue
-        cleaned += char
-
-    # Calculate visual width (some characters may be wider)
-    visual_length = 0
-    for char in cleaned:
-        # Most characters are width 1, but some CJK characters might be width 2
-        if unicodedata.east_asian_width(char) in ['F', 'W']:  # Fullwidth or Wide
-            visual_length += 2
-        else:
-            visual_length += 1
+    cleaned = text.translate(INVISIBLE_CHAR_TABLE)
+
+    # ASCII text is all narrow, so its width is its length and no per-character pass is needed
+    if cleaned.isascii():
+        return cleaned, len(cleaned)
+
+    # Calculate visual width (most characters are width 1, but some CJK characters might be width 2)
+    visual_length = sum(1 if ord(char) < 128 else char_width(char) for char in cleaned)
 
     return cleaned, visual_length
 
 
+def dash_pad(count):
+    """Return count '—' padding characters, using the precomputed strings for line-sized paddings"""
+    return DASH_PADS.get(count) or '—' * count
+
+
+def dot_pad(count):
+    """Return count '.' padding characters, using the precomputed strings for line-sized paddings"""
+    return DOT_PADS.get(count) or '.' * count
+
+
 def get_text_length_without_tags(text):
     """Calculate the text length without XML/HTML tags"""
     # Remove all XML/HTML tags to get the actual text length
@@ -276,12 +352,13 @@ def format_bio_line(bio_text, total_width=75):
     return first_line_data, overflow_lines
 
 
+@functools.lru_cache(maxsize=256)
 def format_line(key, value, total_width=75, separator=":"):
     """Format a line to be exactly the specified width"""
     # Handle special cases for headers
     if key.startswith('—') or key.startswith('-'):
         # This is a header line
-        return key + '—' * (total_width - len(key))
+        return key + dash_pad(total_width - len(key))
 
     # Handle bio overflow
     if key == "BIO_OVERFLOW":
@@ -299,7 +376,7 @@ def format_line(key, value, total_width=75, separator=":"):
         value_part = f" {value[:available_for_value - 3]}..."
         dots_needed = 1
 
-    return f"{key_part}{'.' * dots_needed}{value_part}"
+    return f"{key_part}{dot_pad(dots_needed)}{value_part}"
 
 
 def format_username_header(full_name, username, total_width=75):
@@ -322,12 +399,12 @@ def format_username_header(full_name, username, total_width=75):
         truncated_name = ""
         current_length = 0
         for char in cleaned_name:
-            char_width = 2 if unicodedata.east_asian_width(char) in ['F', 'W'] else 1
-            if current_length + char_width + 3 > available_for_name:  # +3 for "..."
+            width = 1 if ord(char) < 128 else char_width(char)
+            if current_length + width + 3 > available_for_name:  # +3 for "..."
                 truncated_name += "..."
                 break
             truncated_name += char
-            current_length += char_width
+            current_length += width
         cleaned_name = truncated_name
         name_visual_length = current_length + (3 if truncated_name.endswith("...") else 0)
 
@@ -344,14 +421,15 @@ def format_username_header(full_name, username, total_width=75):
     if middle_dashes_needed < 0:
         middle_dashes_needed = 0
 
-    return f"{start_part}{'—' * middle_dashes_needed}{end_part}"
+    return f"{start_part}{dash_pad(middle_dashes_needed)}{end_part}"
 
 
+@functools.lru_cache(maxsize=256)
 def format_styled_line_with_truncation(key, value, total_width=75):
     """Format a styled line with proper truncation that preserves XML structure"""
     # Handle headers first
     if key.startswith('—') or key.startswith('-'):
-        header_line = key + '—' * (total_width - len(key))
+        header_line = key + dash_pad(total_width - len(key))
         return f'<tspan class="separator">{header_line}</tspan>'
 
     # Handle bio overflow
@@ -377,7 +455,7 @@ def format_styled_line_with_truncation(key, value, total_width=75):
         styled_value = value
         dots_needed = max(1, total_width - len(key_part) - text_length - 1)
 
-    dots = '.' * dots_needed
+    dots = dot_pad(dots_needed)
 
     return f'. <tspan class="key">{key}</tspan>:{dots} {styled_value}'
 
@@ -407,7 +485,7 @@ def format_styled_line(key, value, special_styling=None):
     """Format and style a line in one step"""
     # Handle headers first
     if key.startswith('—') or key.startswith('-'):
-        header_line = key + '—' * (75 - len(key))
+        header_line = key + dash_pad(75 - len(key))
         return f'<tspan class="separator">{header_line}</tspan>'
 
     # Handle bio overflow
@@ -423,6 +501,17 @@ def format_styled_line(key, value, special_styling=None):
         return format_styled_line_with_truncation(key, styled_value)
 
 
+def language_record(language_stats, lang_name):
+    """
+    Return the mutable [commits, additions, deletions, color] record of a language,
+    creating it on first use
+    """
+    record = language_stats.get(lang_name)
+    if record is None:
+        record = language_stats[lang_name] = [0, 0, 0, '#000000']
+    return record
+
+
 def calculate_account_age_years(created_at):
     """Calculate the age of the GitHub account in years"""
     created_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
@@ -433,6 +522,9 @@ def calculate_account_age_years(created_at):
 
 def calculate_language_percentages(language_stats):
     """Calculate language usage percentages based on commits"""
+    if not language_stats:
+        return {}
+
     total_commits = sum(lang['commits'] for lang in language_stats.values())
     if total_commits == 0:
         return {}
@@ -458,6 +550,11 @@ def generate_language_bar(language_percentages, width=400):
     if not language_percentages:
         return []
 
+    # A single language fills the whole bar
+    if len(language_percentages) == 1:
+        stats = next(iter(language_percentages.values()))
+        return [f'<rect x="0" y="0" width="{width:.1f}" height="10" fill="{stats["color"]}" rx="1"/>']
+
     elements = []
     x_offset = 0
 
@@ -474,16 +571,46 @@ def generate_language_bar(language_percentages, width=400):
     return elements
 
 
+def load_cached_json(path, max_age=None):
+    """Load a cached JSON response, or return None if it is missing, unreadable or older than max_age seconds"""
+    try:
+        if max_age is not None and time.time() - os.path.getmtime(path) > max_age:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_json(path, data):
+    """Save a JSON response to the cache, ignoring failures since the cache is only an optimization"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+    except OSError as e:
+        print(f"⚠ Warning: Could not write cache file {path}: {e}")
+
+
 class GitHubProfileGenerator:
-    def __init__(self, token, username):
+    def __init__(self, token, username, use_cache=True):
         self.token = token
         self.username = username
+        self.use_cache = use_cache
         self.headers = {
             'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json',
         }
         self.graphql_url = 'https://api.github.com/graphql'
 
+        # Reuse one keep-alive connection pool for every GraphQL call, retrying transient gateway errors
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                        allowed_methods=frozenset({'POST'}),  # GraphQL queries are safe to resend
+                        raise_on_status=False)  # Hand the last response to the status checks below
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries))
+
     def check_is_authenticated_user(self, username):
         """Check if the token's authenticated user matches the provided username"""
         if not self.token:
@@ -499,10 +626,9 @@ class GitHubProfileGenerator:
         """
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.graphql_url,
-                json={'query': query},
-                headers=self.headers
+                json={'query': query}
             )
 
             if response.status_code == 200:
@@ -517,11 +643,8 @@ class GitHubProfileGenerator:
 
         return False
 
-    def get_user_data_multi_year(self, years_back=None):
-        """Fetch user data across multiple years including detailed issue and PR statistics with draft PRs"""
-        end_date = datetime.now()
-
-        # Get basic user info including detailed issue and PR statistics with draft PRs
+    def get_basic_user_info(self):
+        """Fetch basic user info including detailed issue and PR statistics with draft PRs"""
         user_query = """
         query($username: String!) {
             user(login: $username) {
@@ -574,11 +697,17 @@ class GitHubProfileGenerator:
         }
         """
 
+        cache_path = os.path.join(CACHE_DIR, f'user_{self.username}.json')
+        if self.use_cache:
+            user_data = load_cached_json(cache_path, max_age=USER_INFO_CACHE_TTL)
+            if user_data:
+                print(f"✓ Using cached user info: {user_data['name'] or user_data['login']}")
+                return user_data
+
         print(f"Fetching basic user info for {self.username}...")
-        response = requests.post(
+        response = self.session.post(
             self.graphql_url,
-            json={'query': user_query, 'variables': {'username': self.username}},
-            headers=self.headers
+            json={'query': user_query, 'variables': {'username': self.username}}
         )
 
         if response.status_code != 200:
@@ -593,55 +722,32 @@ class GitHubProfileGenerator:
 
         user_data = response_data['data']['user']
         print(f"✓ Found user: {user_data['name'] or user_data['login']}")
-
-        # If years_back is not provided, calculate based on account age
-        if years_back is None:
-            years_back = calculate_account_age_years(user_data['createdAt'])
-            print(f"✓ Using account age: {years_back} years")
-
-        # Debug: Print the PR counts from GraphQL
-        merged_prs_count = user_data.get('mergedPullRequests', {}).get('totalCount', 0)
-        print(
-            f"✓ GraphQL reports {merged_prs_count} merged PRs (this might include PRs from all time, not just recent years)")
-
-        # Process draft PR data
-        draft_prs = 0
-        if user_data.get('draftPullRequests') and user_data['draftPullRequests'].get('nodes'):
-            draft_prs = sum(1 for pr in user_data['draftPullRequests']['nodes'] if pr and pr.get('isDraft', False))
-
-        # Add draft PR count to user data for later use
-        user_data['draftPullRequests'] = {'totalCount': draft_prs}
-
-        # Get contribution data for multiple years
-        contributions_data = {}
-        total_commits = 0
-        language_stats = defaultdict(lambda: {
-            'commits': 0,
-            'additions': 0,
-            'deletions': 0,
-            'color': '#000000'
-        })
-
-        # Fetch data year by year to avoid API limits
-        current_year = end_date.year
-        for year in range(current_year - years_back + 1, current_year + 1):
-            year_start = f"{year}-01-01T00:00:00Z"
-            year_end = f"{year}-12-31T23:59:59Z"
-
-            print(f"Fetching contributions for {year}...")
-
-            # Fixed query with proper pagination
-            contributions_query = """
-            query($username: String!, $from: DateTime!, $to: DateTime!) {
-                user(login: $username) {
-                    contributionsCollection(from: $from, to: $to) {
+        if self.use_cache:
+            save_cached_json(cache_path, user_data)
+        return user_data
+
+    def get_contributions_by_year(self, years):
+        """Fetch the contributions collection of every year in one request, keyed by 'y<year>' aliases"""
+        # Closed years never change, so they are served from the cache and only the rest is fetched
+        current_year = datetime.now().year
+        user_contrib = {}
+        if self.use_cache:
+            for year in years:
+                if year < current_year:
+                    cached = load_cached_json(self._contributions_cache_path(year))
+                    if cached is not None:
+                        user_contrib[f'y{year}'] = cached
+        years_to_fetch = [year for year in years if f'y{year}' not in user_contrib]
+        if not years_to_fetch:
+            print(f"✓ Using cached contributions for {years.start}-{years.stop - 1}")
+            return user_contrib
+
+        # Fields selected for each year, limited to what get_user_data_multi_year reads;
+        # aliased per year so all years share one request
+        contribution_fields = """
                         totalCommitContributions
                         commitContributionsByRepository {
                             repository {
-                                name
-                                owner {
-                                    login
-                                }
                                 primaryLanguage {
                                     name
                                     color
@@ -656,56 +762,119 @@ class GitHubProfileGenerator:
                                     }
                                 }
                             }
-                            contributions(first: 100) {
+                            contributions {
                                 totalCount
-                                nodes {
-                                    commitCount
-                                    occurredAt
-                                }
                             }
                         }
-                    }
-                }
-            }
+                    """
+
+        year_selections = []
+        variable_definitions = ['$username: String!']
+        variables = {'username': self.username}
+        for year in years_to_fetch:
+            variable_definitions.append(f'$from{year}: DateTime!, $to{year}: DateTime!')
+            variables[f'from{year}'] = f"{year}-01-01T00:00:00Z"
+            variables[f'to{year}'] = f"{year}-12-31T23:59:59Z"
+            year_selections.append(
+                f"\n                    y{year}: contributionsCollection(from: $from{year}, to: $to{year}) {{"
+                f"{contribution_fields}}}"
+            )
+
+        contributions_query = f"""
+            query({', '.join(variable_definitions)}) {{
+                user(login: $username) {{{''.join(year_selections)}
+                }}
+            }}
             """
 
-            response = requests.post(
-                self.graphql_url,
-                json={
-                    'query': contributions_query,
-                    'variables': {
-                        'username': self.username,
-                        'from': year_start,
-                        'to': year_end
-                    }
-                },
-                headers=self.headers
-            )
+        print(f"Fetching contributions for {', '.join(str(year) for year in years_to_fetch)}...")
+        response = self.session.post(
+            self.graphql_url,
+            json={
+                'query': contributions_query,
+                'variables': variables
+            }
+        )
 
-            if response.status_code != 200:
-                print(f"⚠ Warning: Failed to fetch data for {year}: {response.status_code}")
-                continue
+        if response.status_code != 200:
+            print(f"⚠ Warning: Failed to fetch contribution data: {response.status_code}")
+            return user_contrib
 
-            response_data = response.json()
-            if 'errors' in response_data:
-                print(f"⚠ Warning: GraphQL errors for {year}: {response_data['errors']}")
-                continue
+        response_data = response.json()
+        has_errors = 'errors' in response_data
+        if has_errors:
+            print(f"⚠ Warning: GraphQL errors while fetching contributions: {response_data['errors']}")
+        if not response_data.get('data') or not response_data['data'].get('user'):
+            print("⚠ Warning: No user data returned for contributions")
+            return user_contrib
 
-            if not response_data.get('data') or not response_data['data'].get('user'):
-                print(f"⚠ Warning: No user data returned for {year}")
-                continue
+        fetched = response_data['data']['user']
+        user_contrib.update(fetched)
+        if self.use_cache and not has_errors:
+            for year in years_to_fetch:
+                if year < current_year and fetched.get(f'y{year}'):
+                    save_cached_json(self._contributions_cache_path(year), fetched[f'y{year}'])
+
+        return user_contrib
+
+    def _contributions_cache_path(self, year):
+        """Path of the cached contributions collection for a closed year"""
+        return os.path.join(CACHE_DIR, f'contribs_{self.username}_{year}.json')
+
+    def get_user_data_multi_year(self, years_back=None):
+        """Fetch user data across multiple years including detailed issue and PR statistics with draft PRs"""
+        current_year = datetime.now().year
+
+        if years_back is None:
+            # The year range depends on the account age, so the user info has to come first
+            user_data = self.get_basic_user_info()
+            years_back = calculate_account_age_years(user_data['createdAt'])
+            print(f"✓ Using account age: {years_back} years")
+            years = range(current_year - years_back + 1, current_year + 1)
+            user_contrib = self.get_contributions_by_year(years)
+        else:
+            # Both queries are independent, so overlap their round trips
+            years = range(current_year - years_back + 1, current_year + 1)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                contrib_future = executor.submit(self.get_contributions_by_year, years)
+                user_data = self.get_basic_user_info()
+                user_contrib = contrib_future.result()
+
+        # Debug: Print the PR counts from GraphQL
+        merged_prs_count = user_data.get('mergedPullRequests', {}).get('totalCount', 0)
+        print(
+            f"✓ GraphQL reports {merged_prs_count} merged PRs (this might include PRs from all time, not just recent years)")
+
+        # Process draft PR data
+        draft_prs = 0
+        if user_data.get('draftPullRequests') and user_data['draftPullRequests'].get('nodes'):
+            draft_prs = sum(1 for pr in user_data['draftPullRequests']['nodes'] if pr and pr.get('isDraft', False))
 
-            user_contrib = response_data['data']['user']
-            if not user_contrib.get('contributionsCollection'):
+        # Add draft PR count to user data for later use
+        user_data['draftPullRequests'] = {'totalCount': draft_prs}
+
+        # Get contribution data for multiple years
+        contributions_data = {}
+        total_commits = 0
+        # Per-language [commits, additions, deletions, color] records, see language_record()
+        language_stats = {}
+
+        lang_color_fallback = LANGUAGE_COLORS.get  # Bound once for the loops below
+        for year in years:
+            year_data = user_contrib.get(f'y{year}')
+            if not year_data:
                 print(f"⚠ Warning: No contributions collection for {year}")
                 continue
 
-            year_data = user_contrib['contributionsCollection']
             contributions_data[year] = year_data
             year_commits = year_data.get('totalCommitContributions', 0)
             total_commits += year_commits
             print(f"  ✓ {year}: {year_commits} commits")
 
+            # No commits means no per-repository contributions to walk
+            if year_commits == 0:
+                continue
+
             # Process language statistics
             commit_contribs = year_data.get('commitContributionsByRepository', [])
             if not commit_contribs:
@@ -727,9 +896,9 @@ class GitHubProfileGenerator:
                 primary_lang = repo.get('primaryLanguage')
                 if primary_lang and primary_lang.get('name'):
                     lang_name = primary_lang['name']
-                    lang_color = primary_lang.get('color') or LANGUAGE_COLORS.get(lang_name, '#000000')
-                    language_stats[lang_name]['commits'] += commit_count
-                    language_stats[lang_name]['color'] = lang_color
+                    stats = language_record(language_stats, lang_name)
+                    stats[0] += commit_count
+                    stats[3] = primary_lang.get('color') or lang_color_fallback(lang_name, '#000000')
 
                 # Process all languages in repo (weighted by usage)
                 languages = repo.get('languages', {})
@@ -745,17 +914,18 @@ class GitHubProfileGenerator:
                             if not lang_name:
                                 continue
 
-                            lang_color = node.get('color') or LANGUAGE_COLORS.get(lang_name, '#000000')
                             edge_size = edge.get('size', 0)
                             lang_proportion = edge_size / total_size
                             weighted_commits = int(commit_count * lang_proportion)
 
                             if weighted_commits > 0:
-                                language_stats[lang_name]['commits'] += weighted_commits
-                                language_stats[lang_name]['color'] = lang_color
+                                # Look the entry up once and only resolve the color when it is stored
+                                stats = language_record(language_stats, lang_name)
+                                stats[0] += weighted_commits
+                                stats[3] = node.get('color') or lang_color_fallback(lang_name, '#000000')
                                 # Estimate additions/deletions (rough approximation)
-                                language_stats[lang_name]['additions'] += int(edge_size * 0.3)
-                                language_stats[lang_name]['deletions'] += int(edge_size * 0.1)
+                                stats[1] += int(edge_size * 0.3)
+                                stats[2] += int(edge_size * 0.1)
 
         print(f"✓ Total commits collected: {total_commits}")
         print(f"✓ Languages found: {len(language_stats)}")
@@ -764,7 +934,10 @@ class GitHubProfileGenerator:
         return {
             'user': user_data,
             'total_commits': total_commits,
-            'language_stats': dict(language_stats),
+            'language_stats': {
+                lang: {'commits': commits, 'additions': additions, 'deletions': deletions, 'color': color}
+                for lang, (commits, additions, deletions, color) in language_stats.items()
+            },
             'contributions_data': contributions_data
         }
 
@@ -790,7 +963,6 @@ class GitHubProfileGenerator:
         content_height = 600  # Default fallback
 
         # Extract height from content SVG
-        import re
         height_match = re.search(r'height="(\d+)px"', content_svg)
         if height_match:
             content_height = int(height_match.group(1))
@@ -810,7 +982,7 @@ class GitHubProfileGenerator:
         # Generate window title
         window_title = f"Terminal — {self.username}@github.com"
 
-        window_svg = f'''<?xml version='1.0' encoding='UTF-8'?>
+        parts = [f'''<?xml version='1.0' encoding='UTF-8'?>
 <svg xmlns="http://www.w3.org/2000/svg" font-family="'Monaspace Krypton',monospace" width="{window_width}px" height="{window_height}px" font-size="14px">
 <defs>
     <filter id="window-shadow" x="-20%" y="-20%" width="140%" height="140%">
@@ -842,7 +1014,7 @@ class GitHubProfileGenerator:
 
 <!-- Content area positioned directly below titlebar -->
 <g transform="translate(0, {titlebar_height})">
-'''
+''']
 
         # Extract the content from the original SVG and modify it to remove border radius
         content_start = content_svg.find('<style>')
@@ -853,23 +1025,28 @@ class GitHubProfileGenerator:
             # Remove the border radius from the background rectangle in window mode
             content_body = re.sub(r'<rect width="[^"]*" height="[^"]*" fill="[^"]*" rx="15"/>',
                                   lambda m: m.group(0).replace(' rx="15"', ''), content_body)
-            window_svg += content_body
+            parts.append(content_body)
 
-        window_svg += '''
+        parts.append('''
 </g>
-</svg>'''
+</svg>''')
 
-        return window_svg
+        return ''.join(parts)
 
-    def generate_svg(self, data, mode='dark', macos_window=False):
+    def generate_svg(self, data, mode='dark', macos_window=False, language_percentages=None):
         """Generate the complete SVG"""
         user = data['user']
-        language_percentages = calculate_language_percentages(data['language_stats'])
+        language_stats = data['language_stats']
+        if language_percentages is None:
+            language_percentages = calculate_language_percentages(language_stats)
 
-        # Calculate total lines of code
-        total_additions = sum(lang['additions'] for lang in data['language_stats'].values())
-        total_deletions = sum(lang['deletions'] for lang in data['language_stats'].values())
-        net_lines = total_additions - total_deletions
+        # Calculate total lines of code (nothing to sum for accounts without stats)
+        if language_stats:
+            total_additions = sum(lang['additions'] for lang in language_stats.values())
+            total_deletions = sum(lang['deletions'] for lang in language_stats.values())
+            net_lines = total_additions - total_deletions
+        else:
+            total_additions = total_deletions = net_lines = 0
 
         # Color schemes
         if mode == 'dark':
@@ -953,7 +1130,7 @@ class GitHubProfileGenerator:
         border_radius = "0" if macos_window else "15"
 
         # Start building SVG with updated font and styling
-        svg_content = f'''<?xml version='1.0' encoding='UTF-8'?>
+        parts = [f'''<?xml version='1.0' encoding='UTF-8'?>
 <svg xmlns="http://www.w3.org/2000/svg" font-family="'Monaspace Krypton',monospace" width="{svg_width}px" height="{svg_height}px" font-size="14px">
 <style>
 @import url("https://cdn.jsdelivr.net/gh/iXORTech/webfonts@main/monaspace/krypton/krypton.css");
@@ -980,36 +1157,11 @@ text, tspan {{white-space: pre;}}
     animation: blink 1s infinite;
 }}
 </style>
-<rect width="{svg_width}px" height="{svg_height}px" fill="{bg_color}" rx="{border_radius}"/>'''
+<rect width="{svg_width}px" height="{svg_height}px" fill="{bg_color}" rx="{border_radius}"/>''']
 
         # ASCII art positioned at x=25
-        ascii_x = 25
-        svg_content += f'''
-<text x="{ascii_x}" y="30" fill="{text_color}" class="ascii">
-    <tspan x="{ascii_x}" y="50">                  @</tspan>
-    <tspan x="{ascii_x}" y="70">              @@    @@</tspan>
-    <tspan x="{ascii_x}" y="90">           @@@        @@@</tspan>
-    <tspan x="{ascii_x}" y="110">        @-     @@  @@      @</tspan>
-    <tspan x="{ascii_x}" y="130">     @ @#       @@@@       @@ @</tspan>
-    <tspan x="{ascii_x}" y="150">  %      +@@ @@      @@ @@+      @</tspan>
-    <tspan x="{ascii_x}" y="170">*@@      :@@ @@      @@ @@+      @@*</tspan>
-    <tspan x="{ascii_x}" y="190">%<tspan class="green">-</tspan>#@@@%@-       @@@@       .@#@@##<tspan class="red">=</tspan>%</tspan>
-    <tspan x="{ascii_x}" y="210">@<tspan class="green">=**+-</tspan>@@@:    #@@  @@.    -@%@<tspan class="red">*+++=</tspan>%</tspan>
-    <tspan x="{ascii_x}" y="230">@<tspan class="green">*-=+-</tspan>@<tspan class="green">:*</tspan>@@@@@        @@@@##<tspan class="red">-</tspan>@<tspan class="red">=+==+</tspan>@</tspan>
-    <tspan x="{ascii_x}" y="250">@<tspan class="green">-</tspan>@@@<tspan class="green">:</tspan>@<tspan class="green">:**=-</tspan>@<tspan class="green">*</tspan>@@    @@#@<tspan class="red">+=++-</tspan>@<tspan class="red">=</tspan>#@@<tspan class="red">=</tspan>%</tspan>
-    <tspan x="{ascii_x}" y="270">@<tspan class="green">--==</tspan>@@@<tspan class="green">=---</tspan>@<tspan class="green">:+%</tspan>@@@%#<tspan class="red">+-</tspan>@<tspan class="red">+===</tspan>#@@<tspan class="red">+===</tspan>@</tspan>
-    <tspan x="{ascii_x}" y="290">@<tspan class="green">-=**:</tspan>@<tspan class="green">:</tspan>@@@<tspan class="green">-</tspan>@<tspan class="green">:**=</tspan>%%<tspan class="red">=*+=</tspan>@<tspan class="red">+</tspan>@@@<tspan class="red">-</tspan>@<tspan class="red">=+++=</tspan>%</tspan>
-    <tspan x="{ascii_x}" y="310">@@<tspan class="green">%=-:</tspan>@<tspan class="green">:=--*</tspan>@@<tspan class="green">*-:</tspan>##<tspan class="red">-=+</tspan>@@#<tspan class="red">==+-</tspan>@<tspan class="red">-=+#</tspan>@%</tspan>
-    <tspan x="{ascii_x}" y="330">@<tspan class="green">-=</tspan>@@#@<tspan class="green">:=*+=</tspan>@<tspan class="green">:</tspan>#@@@@@@#<tspan class="red">=</tspan>@<tspan class="red">++++-</tspan>@<tspan class="red">*</tspan>@@<tspan class="red">+=</tspan>%</tspan>
-    <tspan x="{ascii_x}" y="350">@<tspan class="green">=+=-:</tspan>@@@<tspan class="green">=-:</tspan>@<tspan class="green">:+-:%</tspan>#<tspan class="red">-=+=</tspan>@<tspan class="red">==+</tspan>@@@<tspan class="red">-==+=</tspan>@</tspan>
-    <tspan x="{ascii_x}" y="370">@<tspan class="green">++**:</tspan>@<tspan class="green">:-</tspan>@@@@<tspan class="green">:-+=</tspan>@@<tspan class="red">=+=-</tspan>@@@@<tspan class="red">=-</tspan>@<tspan class="red">=++-:</tspan>#</tspan>
-    <tspan x="{ascii_x}" y="390"> @@@<tspan class="green">*:</tspan>@<tspan class="green">:+=::</tspan>@@@<tspan class="green">+:</tspan>##<tspan class="red">=+</tspan>@@@<tspan class="red">==++=</tspan>@<tspan class="red">---</tspan>%</tspan>
-    <tspan x="{ascii_x}" y="410">    @@@<tspan class="green">=+==-</tspan>@<tspan class="green">.-</tspan>#@@@@#<tspan class="red">=-</tspan>@<tspan class="red">+++-.</tspan>@%</tspan>
-    <tspan x="{ascii_x}" y="430">        @@<tspan class="green">=-</tspan>@<tspan class="green">:++:*</tspan>#<tspan class="red">-++=</tspan>@<tspan class="red">=:=</tspan>#</tspan>
-    <tspan x="{ascii_x}" y="450">           @@<tspan class="green">-:::%</tspan>@<tspan class="red">==-:</tspan>%%</tspan>
-    <tspan x="{ascii_x}" y="470">              @@<tspan class="green">:+</tspan>*<tspan class="red">:%</tspan>@</tspan>
-    <tspan x="{ascii_x}" y="490">                  *</tspan>
-</text>'''
+        ascii_x = ASCII_X
+        parts.append(render_ascii_art(text_color))
 
         # Main content starts at x=360
         x_main = 360
@@ -1022,10 +1174,7 @@ text, tspan {{white-space: pre;}}
         # Always use the dash format for every username
         header_line = format_username_header(display_name, username, 75)
 
-        svg_content += f'''
-<text x="{x_main}" y="{y_start}" fill="{text_color}" font-size="14px">
-<tspan x="{x_main}" y="{y_start}">{header_line}</tspan>
-</text>'''
+        parts.append(TEXT_ROW.format(x=x_main, y=y_start, fill=text_color, line=header_line))
 
         y_current = y_start + 25
 
@@ -1045,16 +1194,18 @@ text, tspan {{white-space: pre;}}
         # Calculate non-draft open PRs
         non_draft_open_prs = open_prs - draft_prs
 
-        # Define special styling for lines with colored content - with pipe separators outside spans
-        special_styling = {
-            "Repository": lambda
-                value: f'<tspan class="value">{repos_owned} (<tspan class="key">Contributed</tspan>: {repos_contributed})</tspan> | <tspan class="value"><tspan class="key">Stars</tspan>: {stars}</tspan> | <tspan class="value"><tspan class="key">Followers</tspan>: {followers}</tspan>',
-            "Commits": lambda
-                value: f'<tspan class="value">{data["total_commits"]:,}</tspan> | <tspan class="value"><tspan class="key">Lines</tspan>: {net_lines:,} ( <tspan class="addColor">{total_additions:,}++</tspan>,  <tspan class="delColor">{total_deletions:,}--</tspan> )</tspan>',
-            "Issues": lambda
-                value: f'<tspan class="value"><tspan class="key">Open</tspan>: <tspan class="green">{open_issues}</tspan></tspan> | <tspan class="value"><tspan class="key">Closed</tspan>: <tspan class="red">{closed_issues}</tspan></tspan>',
-            "Pull Requests": lambda
-                value: f'<tspan class="value"><tspan class="key">Open</tspan>: <tspan class="green">{non_draft_open_prs}</tspan></tspan> | <tspan class="value"><tspan class="key">Draft</tspan>: <tspan class="gray">{draft_prs}</tspan></tspan> | <tspan class="value"><tspan class="key">Merged</tspan>: <tspan class="purple">{merged_prs}</tspan></tspan> | <tspan class="value"><tspan class="key">Closed</tspan>: <tspan class="red">{closed_prs}</tspan></tspan>'
+        # Thousands-separated totals used by the Commits line
+        commits_fmt = f"{data['total_commits']:,}"
+        net_fmt = f"{net_lines:,}"
+        add_fmt = f"{total_additions:,}"
+        del_fmt = f"{total_deletions:,}"
+
+        # Pre-styled values for the GitHub Statistics lines - with pipe separators outside spans
+        special_values = {
+            "Repository": f'<tspan class="value">{repos_owned} (<tspan class="key">Contributed</tspan>: {repos_contributed})</tspan> | <tspan class="value"><tspan class="key">Stars</tspan>: {stars}</tspan> | <tspan class="value"><tspan class="key">Followers</tspan>: {followers}</tspan>',
+            "Commits": f'<tspan class="value">{commits_fmt}</tspan> | <tspan class="value"><tspan class="key">Lines</tspan>: {net_fmt} ( <tspan class="addColor">{add_fmt}++</tspan>,  <tspan class="delColor">{del_fmt}--</tspan> )</tspan>',
+            "Issues": f'<tspan class="value"><tspan class="key">Open</tspan>: <tspan class="green">{open_issues}</tspan></tspan> | <tspan class="value"><tspan class="key">Closed</tspan>: <tspan class="red">{closed_issues}</tspan></tspan>',
+            "Pull Requests": f'<tspan class="value"><tspan class="key">Open</tspan>: <tspan class="green">{non_draft_open_prs}</tspan></tspan> | <tspan class="value"><tspan class="key">Draft</tspan>: <tspan class="gray">{draft_prs}</tspan></tspan> | <tspan class="value"><tspan class="key">Merged</tspan>: <tspan class="purple">{merged_prs}</tspan></tspan> | <tspan class="value"><tspan class="key">Closed</tspan>: <tspan class="red">{closed_prs}</tspan></tspan>'
         }
 
         # Render all content lines dynamically
@@ -1064,49 +1215,40 @@ text, tspan {{white-space: pre;}}
                 y_current += line_height
                 continue
 
+            # GitHub Statistics lines take their pre-styled value, looked up once
+            special_value = special_values.get(key)
+            if special_value is not None:
+                styled_line = format_styled_line_with_truncation(key, special_value)
             # Handle Bio specially - value is a tuple (dots_count, bio_text)
-            if key == "Bio":
+            elif key == "Bio":
                 dots_count, bio_text = value
                 # Create the line with proper styling: dots are normal text color, bio text is blue
-                styled_line = f'. <tspan class="key">Bio</tspan>:{"." * dots_count}'
+                styled_line = f'. <tspan class="key">Bio</tspan>:{dot_pad(dots_count)}'
                 if bio_text:
                     styled_line += f' <tspan class="value">{bio_text}</tspan>'
             elif key == "BIO_OVERFLOW":
                 styled_line = f'<tspan class="value">{value}</tspan>'
-            # Replace placeholder values for GitHub Statistics - just pass placeholders as special styling handles the formatting
-            elif key in ["Repository", "Commits", "Issues", "Pull Requests"]:
-                value = "PLACEHOLDER"  # Will be replaced by special styling
-                styled_line = format_styled_line(key, value, special_styling)
             else:
-                styled_line = format_styled_line(key, value, special_styling)
+                styled_line = format_styled_line(key, value)
 
-            svg_content += f'''
-<text x="{x_main}" y="{y_current}" fill="{text_color}" font-size="14px">
-<tspan x="{x_main}" y="{y_current}">{styled_line}</tspan>
-</text>'''
+            parts.append(TEXT_ROW.format(x=x_main, y=y_current, fill=text_color, line=styled_line))
             y_current += line_height
 
         # Language progress bar and stats (no spacing before bar)
         if language_percentages:
             # Add progress bar - width 560
-            svg_content += f'<g transform="translate({x_main}, {y_current})">'
+            parts.append(f'<g transform="translate({x_main}, {y_current})">')
             bar_elements = generate_language_bar(language_percentages, 560)
-            for element in bar_elements:
-                svg_content += f'  {element}'
-            svg_content += '</g>'
+            if bar_elements:
+                parts.append('  ' + '  '.join(bar_elements))
+            parts.append('</g>')
 
             y_current += 35  # Spacing after language bar before language details
 
             # Language details
-            for i, (lang, stats) in enumerate(list(language_percentages.items())[:10]):  # Show top 10 languages
-                percentage_str = f"{stats['percentage']:.1f}%"
-                commits_str = f"{stats['commits']:,} commits"
-                lines_str = f"(+{stats['additions']:,} -{stats['deletions']:,})"
-
-                svg_content += f'''
-<text x="{x_main}" y="{y_current}" fill="{text_color}" font-size="14px">
-<tspan x="{x_main}" y="{y_current}">  <tspan style="fill:{stats['color']}">●</tspan> <tspan class="key">{lang}</tspan>: <tspan class="value">{percentage_str}</tspan> <tspan class="value">{commits_str}</tspan> <tspan class="value">{lines_str}</tspan></tspan>
-</text>'''
+            for lang, stats in itertools.islice(language_percentages.items(), 10):  # Show top 10 languages
+                language_line = f'''  <tspan style="fill:{stats['color']}">●</tspan> <tspan class="key">{lang}</tspan>: <tspan class="value">{stats['percentage']:.1f}%</tspan> <tspan class="value">{stats['commits']:,} commits</tspan> <tspan class="value">(+{stats['additions']:,} -{stats['deletions']:,})</tspan>'''
+                parts.append(TEXT_ROW.format(x=x_main, y=y_current, fill=text_color, line=language_line))
                 y_current += line_height
 
         # Add notes at the bottom, aligned with ASCII art (x=25)
@@ -1116,31 +1258,23 @@ text, tspan {{white-space: pre;}}
         current_time = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
 
         # Add generation timestamp note
-        svg_content += f'''
-<text x="{ascii_x}" y="{y_current}" fill="{text_color}" class="note">
-<tspan x="{ascii_x}" y="{y_current}" class="note">Generated on {current_time}</tspan>
-</text>'''
+        parts.append(f'\n<text x="{ascii_x}" y="{y_current}" fill="{text_color}" class="note"><tspan x="{ascii_x}" y="{y_current}" class="note">Generated on {current_time}</tspan></text>')
 
         # Check if the token's authenticated user matches the provided username
         if self.token:  # Only check if token is provided
             is_authenticated_user = self.check_is_authenticated_user(self.username)
             if is_authenticated_user:
                 y_current += 15  # Space for second note
-                svg_content += f'''
-<text x="{ascii_x}" y="{y_current}" fill="{text_color}" class="note">
-<tspan x="{ascii_x}" y="{y_current}" class="note">These metrics include private contributions.</tspan>
-</text>'''
+                parts.append(f'\n<text x="{ascii_x}" y="{y_current}" fill="{text_color}" class="note"><tspan x="{ascii_x}" y="{y_current}" class="note">These metrics include private contributions.</tspan></text>')
 
         # Add shell prompt with flashing cursor
         y_current += 25
         prompt_text = f"{self.username}@github.com:~$"
 
-        svg_content += f'''
-<text x="{ascii_x}" y="{y_current}" fill="{text_color}" class="prompt">
-<tspan x="{ascii_x}" y="{y_current}" class="prompt">{prompt_text} </tspan><tspan class="cursor blinking">█</tspan>
-</text>'''
+        parts.append(f'\n<text x="{ascii_x}" y="{y_current}" fill="{text_color}" class="prompt"><tspan x="{ascii_x}" y="{y_current}" class="prompt">{prompt_text} </tspan><tspan class="cursor blinking">█</tspan></text>')
 
-        svg_content += '\n</svg>'
+        parts.append('\n</svg>')
+        svg_content = ''.join(parts)
 
         # If macOS window is requested, wrap the content
         if macos_window:
@@ -1149,7 +1283,22 @@ text, tspan {{white-space: pre;}}
         return svg_content
 
 
+def render_and_write(generator, data, mode, output, macos_window, language_percentages):
+    """Render the SVG for one mode and write it to the output path"""
+    svg = generator.generate_svg(data, mode=mode, macos_window=macos_window,
+                                 language_percentages=language_percentages)
+    # One unbuffered write of the encoded document (looping only on short writes)
+    fd = os.open(output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        remaining = memoryview(svg.encode('utf-8'))
+        while remaining:
+            remaining = remaining[os.write(fd, remaining):]
+    finally:
+        os.close(fd)
+
+
 def main():
+    import argparse  # Only needed for the command line entry point
     parser = argparse.ArgumentParser(description='Generate GitHub profile SVGs with language statistics')
     parser.add_argument('--token', help='GitHub Personal Access Token (defaults to GITHUB_TOKEN env var)')
     parser.add_argument('--username', required=True, help='GitHub username')
@@ -1157,6 +1306,7 @@ def main():
     parser.add_argument('--output-dark', default='profile_dark.svg', help='Output file for dark mode SVG')
     parser.add_argument('--output-light', default='profile_light.svg', help='Output file for light mode SVG')
     parser.add_argument('--macos-window', action='store_true', help='Wrap output in macOS-style window')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and skip writing the on-disk response cache')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
 
     args = parser.parse_args()
@@ -1169,7 +1319,7 @@ def main():
 
     try:
         print(f"Fetching GitHub data for {args.username}...")
-        generator = GitHubProfileGenerator(token, args.username)
+        generator = GitHubProfileGenerator(token, args.username, use_cache=not args.no_cache)
 
         if args.years:
             print(f"Collecting {args.years} years of contribution data...")
@@ -1178,29 +1328,38 @@ def main():
 
         data = generator.get_user_data_multi_year(args.years)
 
-        print("Generating dark mode SVG...")
-        dark_svg = generator.generate_svg(data, mode='dark', macos_window=args.macos_window)
-        with open(args.output_dark, 'w', encoding='utf-8') as f:
-            f.write(dark_svg)
+        # Computed once and shared by both renders and the summary below
+        language_percentages = calculate_language_percentages(data['language_stats'])
 
+        # The two modes share only read-only data, so render and write them side by side
+        print("Generating dark mode SVG...")
         print("Generating light mode SVG...")
-        light_svg = generator.generate_svg(data, mode='light', macos_window=args.macos_window)
-        with open(args.output_light, 'w', encoding='utf-8') as f:
-            f.write(light_svg)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(render_and_write, generator, data, mode, output,
+                                args.macos_window, language_percentages)
+                for mode, output in (('dark', args.output_dark), ('light', args.output_light))
+            ]
+            for future in futures:
+                future.result()
 
         window_suffix = " (with macOS window)" if args.macos_window else ""
-        print(f"\nGenerated successfully{window_suffix}!")
-        print(f"Dark mode: {args.output_dark}")
-        print(f"Light mode: {args.output_light}")
+        summary = [
+            f"\nGenerated successfully{window_suffix}!",
+            f"Dark mode: {args.output_dark}",
+            f"Light mode: {args.output_light}",
+        ]
 
         # Print some statistics
-        language_stats = calculate_language_percentages(data['language_stats'])
-        if language_stats:
-            print(f"\nTop languages:")
-            for i, (lang, stats) in enumerate(list(language_stats.items())[:10]):
-                print(f"  {i + 1}. {lang}: {stats['percentage']:.1f}% ({stats['commits']:,} commits)")
+        if language_percentages:
+            summary.append("\nTop languages:")
+            for i, (lang, stats) in enumerate(itertools.islice(language_percentages.items(), 10)):
+                summary.append(f"  {i + 1}. {lang}: {stats['percentage']:.1f}% ({stats['commits']:,} commits)")
         else:
-            print("\nNo language statistics found.")
+            summary.append("\nNo language statistics found.")
+
+        # Emit the whole summary in a single write
+        sys.stdout.write('\n'.join(summary) + '\n')
 
     except Exception as e:
         print(f"Error: {e}")
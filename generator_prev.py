@@ -7,124 +7,288 @@ used by a user based on their commit contributions across repositories.
 Generates terminal-style SVG visualizations similar to GitHub stats cards.
 """
 
+import hashlib
+import itertools
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from collections import defaultdict, Counter
 from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 import argparse
+import functools
 import os
+import sys
+import threading
 import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
-import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape as _xml_escape
+
+# Number of repositories whose commit history is fetched per aliased GraphQL query
+COMMIT_STATS_BATCH_SIZE = 10
+
+# Number of line count queries kept in flight at once, overridable with GH_CONCURRENCY
+LINE_COUNT_WORKERS = max(1, int(os.environ.get("GH_CONCURRENCY", "8")))
+
+# On-disk memo of line count statistics for date ranges that have already ended
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "gh_lang_analyzer")
+
+# Backoff delays in seconds between retries of secondary rate limited requests
+RATE_LIMIT_BACKOFF = (1, 2, 4, 8, 16, 32)
+
+# Commit history selection shared by the per-repository and batched line count queries,
+# limited server-side to the target user's commits and paged with $cursor
+COMMIT_HISTORY_FRAGMENT = """
+fragment CommitHistory on Repository {
+  defaultBranchRef {
+    target {
+      ... on Commit {
+        history(first: 100, since: $since, until: $until, author: {id: $authorId}, after: $cursor) {
+          totalCount
+          pageInfo {
+            hasNextPage
+            endCursor
+          }
+          nodes {
+            oid
+            committedDate
+            additions
+            deletions
+            changedFiles
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+# GitHub language colors (updated from GitHub's linguist), used when the API returns none
+LANGUAGE_COLORS = types.MappingProxyType({
+    "Python": "#3572A5",
+    "JavaScript": "#f1e05a",
+    "TypeScript": "#2b7489",
+    "Java": "#b07219",
+    "C": "#555555",
+    "C++": "#f34b7d",
+    "C#": "#239120",
+    "Go": "#00ADD8",
+    "Rust": "#dea584",
+    "Ruby": "#701516",
+    "PHP": "#4F5D95",
+    "Swift": "#ffac45",
+    "Kotlin": "#F18E33",
+    "Scala": "#c22d40",
+    "Shell": "#89e051",
+    "PowerShell": "#012456",
+    "HTML": "#e34c26",
+    "CSS": "#563d7c",
+    "SCSS": "#c6538c",
+    "Vue": "#2c3e50",
+    "React": "#61dafb",
+    "Angular": "#dd0031",
+    "Svelte": "#ff3e00",
+    "Dart": "#00B4AB",
+    "R": "#198CE7",
+    "MATLAB": "#e16737",
+    "Jupyter Notebook": "#DA5B0B",
+    "Dockerfile": "#384d54",
+    "YAML": "#cb171e",
+    "JSON": "#292929",
+    "XML": "#0060ac",
+    "Markdown": "#083fa1",
+    "LaTeX": "#3D6117",
+    "Vim script": "#199f4b",
+    "Emacs Lisp": "#c065db",
+    "Lua": "#000080",
+    "Perl": "#0298c3",
+    "Haskell": "#5e5086",
+    "Clojure": "#db5855",
+    "F#": "#b845fc",
+    "OCaml": "#3be133",
+    "Erlang": "#B83998",
+    "Elixir": "#6e4a7e",
+    "Crystal": "#000100",
+    "Nim": "#ffc200",
+    "Zig": "#ec915c",
+    "Assembly": "#6E4C13",
+    "VHDL": "#adb2cb",
+    "Verilog": "#b2b7f8",
+    "SQL": "#e38c00",
+    "PLpgSQL": "#336790",
+    "Makefile": "#427819",
+    "CMake": "#DA3434",
+    "Tcl": "#e4cc98",
+    "TeX": "#3D6117",
+    "Batchfile": "#C1F12E",
+    "Visual Basic": "#945db7",
+    "VBA": "#867db1",
+    "AppleScript": "#101F1F",
+    "ActionScript": "#882B0F",
+    "CoffeeScript": "#244776",
+    "LiveScript": "#499886",
+    "Objective-C": "#438eff",
+    "Objective-C++": "#6866fb",
+    "D": "#ba595e",
+    "Pascal": "#E3F171",
+    "Fortran": "#4d41b1",
+    "COBOL": "#000000",
+    "Ada": "#02f88c",
+    "Prolog": "#74283c",
+    "Scheme": "#1e4aec",
+    "Common Lisp": "#3fb68b",
+    "Racket": "#3c5caa",
+    "Smalltalk": "#596706",
+    "Groovy": "#e69f56",
+    "Julia": "#a270ba",
+    "Hack": "#878787",
+    "Processing": "#0096D8",
+    "Arduino": "#bd79d1",
+    "PureScript": "#1D222D",
+    "Elm": "#60B5CC",
+    "Reason": "#ff5847",
+    "F*": "#572e30",
+    "Idris": "#b30000",
+    "Agda": "#315665",
+    "Coq": "#d0b68c",
+    "Lean": "#fff"
+})
+
+# Font stack and box-drawing rows shared by every terminal card, 67 columns wide
+_SVG_FONT = "SF Mono, Monaco, Inconsolata, Roboto Mono, monospace"
+_BLANK_LINE = "│" + " " * 65 + "│"
+_BOX_TOP = "┌─ GitHub Stats " + "─" * 50 + "┐"
+_BOX_BOTTOM = "└" + "─" * 65 + "┘"
+_BOX_RULE = "│  " + "═" * 59 + "   │"
+
+# Filled then empty cells of the 40-cell distribution bar; each bar is a window into it
+_BAR_POOL = "█" * 40 + "░" * 40
+
+# Color roles of the terminal card per theme
+TERMINAL_THEMES = types.MappingProxyType({
+    "dark": types.MappingProxyType({
+        "bg": "#0d1117",
+        "terminal_bg": "#161b22",
+        "header": "#30363d",
+        "border": "#30363d",
+        "text": "#e6edf3",
+        "prompt": "#7c3aed",
+        "cursor": "#f0f6fc",
+        "green": "#2ea043",
+        "red": "#da3633",
+        "yellow": "#fb8500",
+        "blue": "#2f81f7",
+        "gray": "#8b949e"
+    }),
+    "light": types.MappingProxyType({
+        "bg": "#ffffff",
+        "terminal_bg": "#f6f8fa",
+        "header": "#e1e4e8",
+        "border": "#d0d7de",
+        "text": "#24292f",
+        "prompt": "#8250df",
+        "cursor": "#24292f",
+        "green": "#1f883d",
+        "red": "#cf222e",
+        "yellow": "#d1242f",
+        "blue": "#0969da",
+        "gray": "#656d76"
+    })
+})
+
+# Terminal card SVG fragments, laid out exactly as ElementTree used to serialize them
+_SVG_HEADER = (
+    "<?xml version='1.0' encoding='utf-8'?>\n"
+    '<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg" '
+    'style="background-color: transparent;">\n'
+    '  <rect width="{width}" height="{height}" fill="{bg_color}" rx="6" />\n'
+    '  <rect x="20" y="20" width="{inner_width}" height="{inner_height}" fill="{terminal_bg}" '
+    'stroke="{border_color}" stroke-width="1" rx="6" />\n'
+    '  <rect x="20" y="20" width="{inner_width}" height="30" fill="{header_color}" rx="6 6 0 0" />\n'
+    '  <circle cx="35" cy="35" r="4" fill="#ff5f56" />\n'
+    '  <circle cx="50" cy="35" r="4" fill="#ffbd2e" />\n'
+    '  <circle cx="65" cy="35" r="4" fill="#27ca3f" />\n'
+    '  <text x="{title_x}" y="40" font-family="' + _SVG_FONT + '" '
+    'font-size="12" fill="{text_color}" text-anchor="middle" font-weight="500">{title}</text>\n'
+)
+_ROW_TEMPLATE = (
+    '  <text x="{x}" y="{y}" font-family="' + _SVG_FONT + '" '
+    'font-size="11" fill="{fill}" font-weight="{weight}">{text}</text>\n'
+)
+_DOT_TEMPLATE = '  <circle cx="45" cy="{cy}" r="3" fill="{fill}" />\n'
+_SVG_FOOTER = (
+    '  <rect x="{cursor_x}" y="{cursor_y}" width="8" height="12" fill="{cursor_color}">\n'
+    '    <animate attributeName="opacity" values="1;0;1" dur="1.5s" repeatCount="indefinite" />\n'
+    '  </rect>\n'
+    '</svg>'
+)
+
+
+class LanguageAccumulator:
+    """Running totals of one language while analyzing contributions."""
+
+    __slots__ = ("total_commits", "weighted_commits", "repositories", "total_bytes", "total_additions",
+                 "total_deletions", "net_lines", "color", "repo_details")
+
+    def __init__(self):
+        self.total_commits = 0
+        self.weighted_commits = 0
+        self.repositories = set()
+        self.total_bytes = 0
+        self.total_additions = 0
+        self.total_deletions = 0
+        self.net_lines = 0
+        self.color = None
+        self.repo_details = []
 
 
 class GitHubLanguageAnalyzer:
-    def __init__(self, token):
+    def __init__(self, token, use_cache: bool = True):
         """
         Initialize the analyzer with a GitHub personal access token.
 
         Args:
             token (str): GitHub personal access token with appropriate permissions
+            use_cache (bool): Whether to reuse line counts of past date ranges cached on disk
         """
         self.token = token
+        self.use_cache = use_cache
         self.base_url = "https://api.github.com/graphql"
         self.headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
         }
-        # Rate limiting: GitHub allows 5000 points per hour for GraphQL
-        self.request_delay = 0.2  # Increased delay for line count queries
-
-        # GitHub language colors (updated from GitHub's linguist)
-        self.language_colors = {
-            "Python": "#3572A5",
-            "JavaScript": "#f1e05a",
-            "TypeScript": "#2b7489",
-            "Java": "#b07219",
-            "C": "#555555",
-            "C++": "#f34b7d",
-            "C#": "#239120",
-            "Go": "#00ADD8",
-            "Rust": "#dea584",
-            "Ruby": "#701516",
-            "PHP": "#4F5D95",
-            "Swift": "#ffac45",
-            "Kotlin": "#F18E33",
-            "Scala": "#c22d40",
-            "Shell": "#89e051",
-            "PowerShell": "#012456",
-            "HTML": "#e34c26",
-            "CSS": "#563d7c",
-            "SCSS": "#c6538c",
-            "Vue": "#2c3e50",
-            "React": "#61dafb",
-            "Angular": "#dd0031",
-            "Svelte": "#ff3e00",
-            "Dart": "#00B4AB",
-            "R": "#198CE7",
-            "MATLAB": "#e16737",
-            "Jupyter Notebook": "#DA5B0B",
-            "Dockerfile": "#384d54",
-            "YAML": "#cb171e",
-            "JSON": "#292929",
-            "XML": "#0060ac",
-            "Markdown": "#083fa1",
-            "LaTeX": "#3D6117",
-            "Vim script": "#199f4b",
-            "Emacs Lisp": "#c065db",
-            "Lua": "#000080",
-            "Perl": "#0298c3",
-            "Haskell": "#5e5086",
-            "Clojure": "#db5855",
-            "F#": "#b845fc",
-            "OCaml": "#3be133",
-            "Erlang": "#B83998",
-            "Elixir": "#6e4a7e",
-            "Crystal": "#000100",
-            "Nim": "#ffc200",
-            "Zig": "#ec915c",
-            "Assembly": "#6E4C13",
-            "VHDL": "#adb2cb",
-            "Verilog": "#b2b7f8",
-            "SQL": "#e38c00",
-            "PLpgSQL": "#336790",
-            "Makefile": "#427819",
-            "CMake": "#DA3434",
-            "Tcl": "#e4cc98",
-            "TeX": "#3D6117",
-            "Batchfile": "#C1F12E",
-            "Visual Basic": "#945db7",
-            "VBA": "#867db1",
-            "AppleScript": "#101F1F",
-            "ActionScript": "#882B0F",
-            "CoffeeScript": "#244776",
-            "LiveScript": "#499886",
-            "Objective-C": "#438eff",
-            "Objective-C++": "#6866fb",
-            "D": "#ba595e",
-            "Pascal": "#E3F171",
-            "Fortran": "#4d41b1",
-            "COBOL": "#000000",
-            "Ada": "#02f88c",
-            "Prolog": "#74283c",
-            "Scheme": "#1e4aec",
-            "Common Lisp": "#3fb68b",
-            "Racket": "#3c5caa",
-            "Smalltalk": "#596706",
-            "Groovy": "#e69f56",
-            "Julia": "#a270ba",
-            "Hack": "#878787",
-            "Processing": "#0096D8",
-            "Arduino": "#bd79d1",
-            "PureScript": "#1D222D",
-            "Elm": "#60B5CC",
-            "Reason": "#ff5847",
-            "F*": "#572e30",
-            "Idris": "#b30000",
-            "Agda": "#315665",
-            "Coq": "#d0b68c",
-            "Lean": "#fff"
-        }
+        # Rate limiting: GitHub allows 5000 points per hour for GraphQL. Requests only wait
+        # once the remaining budget reported by the API drops below this buffer.
+        self.rate_limit_buffer = 100
+        self._rate_limit_remaining = 5000
+        self._rate_limit_reset = 0.0
+        self._rate_limit_lock = threading.Lock()
+
+        # Persistent session so all GraphQL calls reuse pooled keep-alive connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False
+        )
+        pool_size = max(32, LINE_COUNT_WORKERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", adapter)
+
+        # GraphQL node IDs of users, resolved once for commit history author filters
+        self._user_ids = {}
+        self._user_ids_lock = threading.Lock()
+
+        # Read-only fallback colors shared by all analyzers
+        self.language_colors = LANGUAGE_COLORS
 
     def _make_graphql_request(self, query: str, variables: dict) -> dict:
         """
@@ -137,13 +301,22 @@ class GitHubLanguageAnalyzer:
         Returns:
             dict: GraphQL response data
         """
-        time.sleep(self.request_delay)  # Basic rate limiting
+        for delay in RATE_LIMIT_BACKOFF + (None,):
+            self._wait_for_rate_limit()
+
+            response = self.session.post(
+                self.base_url,
+                json={"query": query, "variables": variables},
+                timeout=30
+            )
+            self._update_rate_limit(response)
+
+            # Secondary rate limits answer 403 (or 429); back off and try again
+            if delay is None or response.status_code not in (403, 429) or "rate limit" not in response.text.lower():
+                break
 
-        response = requests.post(
-            self.base_url,
-            json={"query": query, "variables": variables},
-            headers=self.headers
-        )
+            retry_after = response.headers.get("Retry-After")
+            time.sleep(int(retry_after) if retry_after and retry_after.isdigit() else delay)
 
         if response.status_code != 200:
             raise Exception(f"GraphQL query failed with status {response.status_code}: {response.text}")
@@ -155,16 +328,60 @@ class GitHubLanguageAnalyzer:
 
         return data["data"]
 
-    def _parse_iso_date(self, date_str: str) -> datetime:
+    def _wait_for_rate_limit(self):
+        """
+        Block until the primary rate limit resets if the remaining budget is below the buffer.
+
+        The lock is held while sleeping so that concurrent requests wait for the same reset.
+        """
+        with self._rate_limit_lock:
+            if self._rate_limit_remaining < self.rate_limit_buffer:
+                wait = self._rate_limit_reset - time.time()
+                if wait > 0:
+                    print(f"  ⏳ Rate limit nearly exhausted, waiting {wait:.0f}s for reset...")
+                    time.sleep(wait)
+                # Assume a fresh budget until the next response reports otherwise
+                self._rate_limit_remaining = 5000
+
+    def _update_rate_limit(self, response):
+        """
+        Record the rate limit budget reported in a response's X-RateLimit headers.
+
+        Args:
+            response (requests.Response): Response of a GraphQL request
+        """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+
+        with self._rate_limit_lock:
+            if remaining is not None and remaining.isdigit():
+                self._rate_limit_remaining = int(remaining)
+            if reset is not None and reset.isdigit():
+                self._rate_limit_reset = float(reset)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16384)
+    def _parse_iso_date(date_str: str) -> datetime:
         """
         Parse ISO date string to timezone-aware datetime object.
 
+        Results are memoized, and the 'YYYY-MM-DDTHH:MM:SSZ' form GitHub returns is
+        parsed directly without going through fromisoformat.
+
         Args:
             date_str (str): ISO format date string
 
         Returns:
             datetime: Timezone-aware datetime object
         """
+        if len(date_str) == 20 and date_str[19] == 'Z' and date_str[10] == 'T':
+            try:
+                return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                                int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]),
+                                tzinfo=timezone.utc)
+            except ValueError:
+                pass
+
         if date_str.endswith('Z'):
             # Replace 'Z' with '+00:00' for proper timezone parsing
             date_str = date_str[:-1] + '+00:00'
@@ -208,29 +425,142 @@ class GitHubLanguageAnalyzer:
         """
         start_dt = self._parse_iso_date(from_date)
         end_dt = self._parse_iso_date(to_date)
+        if start_dt >= end_dt:
+            return []
+
+        start_iso = self._to_iso_string(start_dt)
+        end_iso = self._to_iso_string(end_dt)
+        first_year = int(start_iso[:4])
+        last_year = int(end_iso[:4])
+
+        # A range ending exactly at midnight on January 1st does not reach into that year
+        if last_year > first_year and end_iso == f"{last_year}-01-01T00:00:00Z":
+            last_year -= 1
+            end_iso = f"{last_year}-12-31T23:59:59Z"
+
+        # Interior boundaries are always whole UTC years, so format them directly
+        return [
+            (start_iso if year == first_year else f"{year}-01-01T00:00:00Z",
+             end_iso if year == last_year else f"{year}-12-31T23:59:59Z")
+            for year in range(first_year, last_year + 1)
+        ]
+
+    def get_commit_stats_for_repo(self, repo_owner: str, repo_name: str, username: str,
+                                  from_date: str, to_date: str, primary_language: str = "Unknown",
+                                  include_commit_list: bool = False) -> dict:
+        """
+        Get detailed commit statistics including line counts for a specific repository.
+
+        Args:
+            repo_owner (str): Repository owner
+            repo_name (str): Repository name
+            username (str): GitHub username to filter commits
+            from_date (str): Start date in ISO format
+            to_date (str): End date in ISO format
+            primary_language (str): Primary language of the repository for display
+            include_commit_list (bool): Whether to also return the individual commits
 
-        ranges = []
-        current_start = start_dt
+        Returns:
+            dict: Commit statistics with line counts
+        """
+        # The disk cache only holds totals, so commit lists are always fetched fresh
+        cache_path = None if include_commit_list else self._commit_stats_cache_path(
+            repo_owner, repo_name, username, from_date, to_date
+        )
+        cached = self._load_cached_stats(cache_path)
+        if cached is not None:
+            return cached
+
+        try:
+            author_id = self._get_user_id(username)
+            repository = self._fetch_commit_history_page(repo_owner, repo_name, author_id, from_date, to_date)
+            stats = self._summarize_commit_history(repository, repo_owner, repo_name, author_id,
+                                                   from_date, to_date, include_commit_list)
+            self._save_cached_stats(cache_path, stats)
+            return stats
 
-        while current_start < end_dt:
-            # Calculate end of current year or the target end date, whichever is earlier
-            year_end = datetime(current_start.year, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
-            current_end = min(year_end, end_dt)
+        except Exception as e:
+            print(
+                f"  ⚠️  Warning: Could not fetch detailed stats for {repo_owner}/{repo_name} ({primary_language}): {e}")
+            return {"total_additions": 0, "total_deletions": 0, "net_lines": 0, "commit_count": 0}
 
-            ranges.append((
-                self._to_iso_string(current_start),
-                self._to_iso_string(current_end)
-            ))
+    def get_commit_stats_batch(self, repos: List[Tuple[str, str, str]], username: str,
+                               from_date: str, to_date: str) -> List[dict]:
+        """
+        Get detailed commit statistics for several repositories with aliased GraphQL queries.
 
-            # Move to next year
-            current_start = datetime(current_start.year + 1, 1, 1, tzinfo=timezone.utc)
+        Repositories are sent COMMIT_STATS_BATCH_SIZE at a time, one query per batch. If a
+        batch fails, its repositories are retried one by one with get_commit_stats_for_repo.
 
-        return ranges
+        Args:
+            repos (List[Tuple[str, str, str]]): (owner, name, primary_language) of each repository
+            username (str): GitHub username to filter commits
+            from_date (str): Start date in ISO format
+            to_date (str): End date in ISO format
 
-    def get_commit_stats_for_repo(self, repo_owner: str, repo_name: str, username: str,
-                                  from_date: str, to_date: str, primary_language: str = "Unknown") -> dict:
+        Returns:
+            List[dict]: Commit statistics with line counts, in the same order as repos
         """
-        Get detailed commit statistics including line counts for a specific repository.
+        results = [None] * len(repos)
+
+        # Serve repositories whose range has ended from the disk memo, query the rest
+        pending = []
+        for index, (owner, name, _) in enumerate(repos):
+            cache_path = self._commit_stats_cache_path(owner, name, username, from_date, to_date)
+            results[index] = self._load_cached_stats(cache_path)
+            if results[index] is None:
+                pending.append((index, cache_path))
+
+        for batch_start in range(0, len(pending), COMMIT_STATS_BATCH_SIZE):
+            batch_pending = pending[batch_start:batch_start + COMMIT_STATS_BATCH_SIZE]
+            batch = [repos[index] for index, _ in batch_pending]
+
+            params = "".join(f", $owner{i}: String!, $name{i}: String!" for i in range(len(batch)))
+            aliases = "".join(
+                f"\n          r{i}: repository(owner: $owner{i}, name: $name{i}) {{ ...CommitHistory }}"
+                for i in range(len(batch))
+            )
+            query = (f"\n        query($since: GitTimestamp!, $until: GitTimestamp!, $authorId: ID!, $cursor: String"
+                     f"{params}) {{{aliases}\n        }}\n" + COMMIT_HISTORY_FRAGMENT)
+
+            try:
+                author_id = self._get_user_id(username)
+                variables = {"since": from_date, "until": to_date, "authorId": author_id, "cursor": None}
+                for i, (owner, name, _) in enumerate(batch):
+                    variables[f"owner{i}"] = owner
+                    variables[f"name{i}"] = name
+
+                data = self._make_graphql_request(query, variables)
+            except Exception:
+                # Fall back to individual queries so one bad repository does not sink the batch
+                for (index, _), (owner, name, primary_lang) in zip(batch_pending, batch):
+                    results[index] = self.get_commit_stats_for_repo(
+                        owner, name, username, from_date, to_date, primary_lang
+                    )
+                continue
+
+            for i, ((index, cache_path), (owner, name, primary_lang)) in enumerate(zip(batch_pending, batch)):
+                try:
+                    results[index] = self._summarize_commit_history(
+                        data.get(f"r{i}") if data else None, owner, name, author_id, from_date, to_date
+                    )
+                except Exception:
+                    # A later page failed; refetch this repository on its own
+                    results[index] = self.get_commit_stats_for_repo(
+                        owner, name, username, from_date, to_date, primary_lang
+                    )
+                    continue
+                self._save_cached_stats(cache_path, results[index])
+
+        return results
+
+    def _commit_stats_cache_path(self, repo_owner: str, repo_name: str, username: str,
+                                 from_date: str, to_date: str) -> Optional[str]:
+        """
+        Get the disk memo path for a repository's line counts over a date range.
+
+        Only ranges that ended more than a day ago are memoized, since their commits can no
+        longer change; the current range is always fetched so new commits are picked up.
 
         Args:
             repo_owner (str): Repository owner
@@ -238,108 +568,194 @@ class GitHubLanguageAnalyzer:
             username (str): GitHub username to filter commits
             from_date (str): Start date in ISO format
             to_date (str): End date in ISO format
-            primary_language (str): Primary language of the repository for display
 
         Returns:
-            dict: Commit statistics with line counts
+            str, optional: Cache file path, or None if the range must not be cached
         """
-        query = """
-        query($owner: String!, $name: String!, $since: GitTimestamp!, $until: GitTimestamp!) {
-          repository(owner: $owner, name: $name) {
-            defaultBranchRef {
-              target {
-                ... on Commit {
-                  history(first: 100, since: $since, until: $until) {
-                    totalCount
-                    pageInfo {
-                      hasNextPage
-                      endCursor
-                    }
-                    nodes {
-                      oid
-                      committedDate
-                      author {
-                        user {
-                          login
-                        }
-                        email
-                        name
-                      }
-                      additions
-                      deletions
-                      changedFiles
-                      message
-                    }
+        if not self.use_cache:
+            return None
+        if self._parse_iso_date(to_date) > datetime.now(timezone.utc) - timedelta(days=1):
+            return None
+
+        key = json.dumps([repo_owner.lower(), repo_name.lower(), username.lower(), from_date, to_date])
+        return os.path.join(CACHE_DIR, f"stats_{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json")
+
+    def _load_cached_stats(self, cache_path: Optional[str]) -> Optional[dict]:
+        """Load memoized line count statistics, or return None if there are none."""
+        if not cache_path:
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_cached_stats(self, cache_path: Optional[str], stats: dict):
+        """Memoize line count statistics, ignoring failures since the cache is only an optimization."""
+        if not cache_path:
+            return
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(stats, f)
+        except OSError as e:
+            print(f"  ⚠️  Warning: Could not write cache file {cache_path}: {e}")
+
+    def get_commit_stats_ranges(self, range_repos: List[Tuple[str, str, List[Tuple[str, str, str]]]],
+                                username: str) -> List[List[dict]]:
+        """
+        Get detailed commit statistics for repositories over several date ranges concurrently.
+
+        Each range is split into batches of COMMIT_STATS_BATCH_SIZE repositories, and all
+        batches of all ranges are fetched on a pool of LINE_COUNT_WORKERS threads.
+
+        Args:
+            range_repos (List[Tuple[str, str, List[Tuple[str, str, str]]]]): (from_date, to_date, repos)
+                per date range, with repos as (owner, name, primary_language) tuples
+            username (str): GitHub username to filter commits
+
+        Returns:
+            List[List[dict]]: Commit statistics per range, in the same order as its repos
+        """
+        chunks = [
+            (index, from_date, to_date, repos[batch_start:batch_start + COMMIT_STATS_BATCH_SIZE])
+            for index, (from_date, to_date, repos) in enumerate(range_repos)
+            for batch_start in range(0, len(repos), COMMIT_STATS_BATCH_SIZE)
+        ]
+
+        results = [[] for _ in range_repos]
+        if not chunks:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(LINE_COUNT_WORKERS, len(chunks))) as executor:
+            futures = [
+                executor.submit(self.get_commit_stats_batch, batch, username, from_date, to_date)
+                for _, from_date, to_date, batch in chunks
+            ]
+
+        for (index, _, _, _), future in zip(chunks, futures):
+            results[index].extend(future.result())
+
+        return results
+
+    def _get_user_id(self, username: str) -> str:
+        """
+        Get the GraphQL node ID of a user, used to filter commit history by author.
+
+        Args:
+            username (str): GitHub username
+
+        Returns:
+            str: User node ID
+        """
+        key = username.lower()
+        with self._user_ids_lock:
+            if key not in self._user_ids:
+                query = """
+                query($login: String!) {
+                  user(login: $login) {
+                    id
                   }
                 }
-              }
-            }
+                """
+                data = self._make_graphql_request(query, {"login": username})
+                if not data or not data.get("user"):
+                    raise Exception(f"User {username} not found")
+                self._user_ids[key] = data["user"]["id"]
+            return self._user_ids[key]
+
+    def _fetch_commit_history_page(self, repo_owner: str, repo_name: str, author_id: str,
+                                   from_date: str, to_date: str, cursor: Optional[str] = None) -> Optional[dict]:
+        """
+        Fetch one page of a user's commit history in a repository.
+
+        Args:
+            repo_owner (str): Repository owner
+            repo_name (str): Repository name
+            author_id (str): GraphQL node ID of the commit author
+            from_date (str): Start date in ISO format
+            to_date (str): End date in ISO format
+            cursor (str, optional): End cursor of the previous page
+
+        Returns:
+            dict, optional: Repository object selected with the CommitHistory fragment
+        """
+        query = """
+        query($owner: String!, $name: String!, $since: GitTimestamp!, $until: GitTimestamp!,
+              $authorId: ID!, $cursor: String) {
+          repository(owner: $owner, name: $name) {
+            ...CommitHistory
           }
         }
-        """
+        """ + COMMIT_HISTORY_FRAGMENT
 
         variables = {
             "owner": repo_owner,
             "name": repo_name,
             "since": from_date,
-            "until": to_date
+            "until": to_date,
+            "authorId": author_id,
+            "cursor": cursor
         }
 
-        try:
-            data = self._make_graphql_request(query, variables)
-
-            if not data or not data.get("repository") or not data["repository"].get("defaultBranchRef"):
-                return {"total_additions": 0, "total_deletions": 0, "commits": []}
-
-            commits = data["repository"]["defaultBranchRef"]["target"]["history"]["nodes"]
-
-            # Filter commits by the specific user
-            user_commits = []
-            total_additions = 0
-            total_deletions = 0
-
-            for commit in commits:
-                # Check if commit is by the target user (by login or email/name match)
-                is_user_commit = False
+        data = self._make_graphql_request(query, variables)
+        return data.get("repository") if data else None
 
-                if commit["author"]["user"] and commit["author"]["user"]["login"]:
-                    # Direct username match
-                    if commit["author"]["user"]["login"].lower() == username.lower():
-                        is_user_commit = True
-                else:
-                    # For commits without linked GitHub user, we'll skip them
-                    # as we can't reliably attribute them to the user
-                    continue
+    def _summarize_commit_history(self, repository: Optional[dict], repo_owner: str, repo_name: str,
+                                  author_id: str, from_date: str, to_date: str,
+                                  include_commit_list: bool = False) -> dict:
+        """
+        Sum up the line counts of a user's commits in a repository's commit history.
 
-                if is_user_commit:
-                    additions = commit["additions"] or 0
-                    deletions = commit["deletions"] or 0
+        The history is already filtered to the user's commits by the query; any further
+        pages beyond the one in repository are fetched here.
 
-                    user_commits.append({
-                        "oid": commit["oid"],
-                        "date": commit["committedDate"],
-                        "additions": additions,
-                        "deletions": deletions,
-                        "changed_files": commit["changedFiles"] or 0,
-                        "message": commit["message"][:100] + "..." if len(commit["message"]) > 100 else commit[
-                            "message"]
-                    })
+        Args:
+            repository (dict, optional): Repository object selected with the CommitHistory fragment
+            repo_owner (str): Repository owner
+            repo_name (str): Repository name
+            author_id (str): GraphQL node ID of the commit author
+            from_date (str): Start date in ISO format
+            to_date (str): End date in ISO format
+            include_commit_list (bool): Whether to also return the individual commits
 
-                    total_additions += additions
-                    total_deletions += deletions
+        Returns:
+            dict: Commit statistics with line counts
+        """
+        if not repository or not repository.get("defaultBranchRef"):
+            return {"total_additions": 0, "total_deletions": 0, "net_lines": 0, "commit_count": 0}
+
+        history = repository["defaultBranchRef"]["target"]["history"]
+        commits = list(history["nodes"])
+
+        # Follow the pagination so repositories with more than 100 commits are fully counted
+        while history["pageInfo"]["hasNextPage"]:
+            repository = self._fetch_commit_history_page(
+                repo_owner, repo_name, author_id, from_date, to_date, history["pageInfo"]["endCursor"]
+            )
+            history = repository["defaultBranchRef"]["target"]["history"]
+            commits.extend(history["nodes"])
+
+        total_additions = sum(commit["additions"] or 0 for commit in commits)
+        total_deletions = sum(commit["deletions"] or 0 for commit in commits)
+
+        stats = {
+            "total_additions": total_additions,
+            "total_deletions": total_deletions,
+            "net_lines": total_additions - total_deletions,
+            "commit_count": len(commits)
+        }
 
-            return {
-                "total_additions": total_additions,
-                "total_deletions": total_deletions,
-                "net_lines": total_additions - total_deletions,
-                "commits": user_commits,
-                "commit_count": len(user_commits)
-            }
+        if include_commit_list:
+            stats["commits"] = [{
+                "oid": commit["oid"],
+                "date": commit["committedDate"],
+                "additions": commit["additions"] or 0,
+                "deletions": commit["deletions"] or 0,
+                "changed_files": commit["changedFiles"] or 0
+            } for commit in commits]
 
-        except Exception as e:
-            print(
-                f"  ⚠️  Warning: Could not fetch detailed stats for {repo_owner}/{repo_name} ({primary_language}): {e}")
-            return {"total_additions": 0, "total_deletions": 0, "net_lines": 0, "commits": [], "commit_count": 0}
+        return stats
 
     def get_user_contributions_range(self, username: str, from_date: str, to_date: str,
                                      include_line_counts: bool = True) -> dict:
@@ -377,6 +793,9 @@ class GitHubLanguageAnalyzer:
             "line_stats": {"total_additions": 0, "total_deletions": 0, "net_lines": 0}
         })
 
+        # Public repositories queued for line counts, fetched once over the full range
+        line_count_repos = {}
+
         for i, (range_start, range_end) in enumerate(year_ranges, 1):
             print(f"  🔄 Fetching year {i}/{len(year_ranges)}: {range_start[:4]} "
                   f"({range_start[:10]} to {range_end[:10]})")
@@ -412,18 +831,25 @@ class GitHubLanguageAnalyzer:
                     repo_contrib["contributions"]["nodes"]
                 )
 
-                # Fetch line count statistics if requested
-                if include_line_counts and not repo["isPrivate"]:  # Skip private repos for line counts
+                # Queue line count statistics if requested
+                if include_line_counts and not repo["isPrivate"] and repo_key not in line_count_repos:
                     primary_lang = repo["primaryLanguage"]["name"] if repo["primaryLanguage"] else "Unknown"
-                    print(f"    📊 Fetching line counts for {repo_key} ({primary_lang})")
                     owner, name = repo_key.split('/')
-                    line_stats = self.get_commit_stats_for_repo(
-                        owner, name, username, range_start, range_end, primary_lang
-                    )
-
-                    repo_contributions[repo_key]["line_stats"]["total_additions"] += line_stats["total_additions"]
-                    repo_contributions[repo_key]["line_stats"]["total_deletions"] += line_stats["total_deletions"]
-                    repo_contributions[repo_key]["line_stats"]["net_lines"] += line_stats["net_lines"]
+                    line_count_repos[repo_key] = (owner, name, primary_lang)
+
+        # Fetch line counts once per repository over the whole date range
+        if line_count_repos:
+            for repo_key, (_, _, primary_lang) in line_count_repos.items():
+                print(f"    📊 Fetching line counts for {repo_key} ({primary_lang})")
+            range_stats = self.get_commit_stats_ranges(
+                [(from_date, to_date, list(line_count_repos.values()))], username
+            )[0]
+            for repo_key, line_stats in zip(line_count_repos, range_stats):
+                repo_contributions[repo_key]["line_stats"] = {
+                    "total_additions": line_stats["total_additions"],
+                    "total_deletions": line_stats["total_deletions"],
+                    "net_lines": line_stats["net_lines"]
+                }
 
         # Convert aggregated data back to expected format
         for repo_key, repo_data in repo_contributions.items():
@@ -470,7 +896,7 @@ class GitHubLanguageAnalyzer:
                     name
                     color
                   }
-                  languages(first: 15, orderBy: {field: SIZE, direction: DESC}) {
+                  languages(first: 8, orderBy: {field: SIZE, direction: DESC}) {
                     edges {
                       node {
                         name
@@ -544,6 +970,8 @@ class GitHubLanguageAnalyzer:
             # Add line count statistics for single year
             if include_line_counts and data and data.get("user"):
                 print("📊 Fetching line count statistics...")
+                public_contribs = []
+                public_repos = []
                 for repo_contrib in data["user"]["contributionsCollection"]["commitContributionsByRepository"]:
                     repo = repo_contrib["repository"]
                     if not repo["isPrivate"]:  # Skip private repos
@@ -552,17 +980,18 @@ class GitHubLanguageAnalyzer:
                         owner, name = repo_key.split('/')
                         print(f"    📊 Fetching line counts for {repo_key} ({primary_lang})")
 
-                        line_stats = self.get_commit_stats_for_repo(
-                            owner, name, username, from_date, to_date, primary_lang
-                        )
-
-                        repo_contrib["line_stats"] = line_stats
+                        public_contribs.append(repo_contrib)
+                        public_repos.append((owner, name, primary_lang))
                     else:
                         repo_contrib["line_stats"] = {
                             "total_additions": 0, "total_deletions": 0,
-                            "net_lines": 0, "commits": [], "commit_count": 0
+                            "net_lines": 0, "commit_count": 0
                         }
 
+                range_stats = self.get_commit_stats_ranges([(from_date, to_date, public_repos)], username)[0]
+                for repo_contrib, line_stats in zip(public_contribs, range_stats):
+                    repo_contrib["line_stats"] = line_stats
+
             return data
         else:
             # Use multi-year aggregation
@@ -590,17 +1019,7 @@ class GitHubLanguageAnalyzer:
         commit_contributions = contributions["commitContributionsByRepository"]
 
         # Language statistics with line count tracking
-        language_stats = defaultdict(lambda: {
-            "total_commits": 0,
-            "weighted_commits": 0,
-            "repositories": set(),
-            "total_bytes": 0,
-            "total_additions": 0,
-            "total_deletions": 0,
-            "net_lines": 0,
-            "color": None,
-            "repo_details": []
-        })
+        language_stats = defaultdict(LanguageAccumulator)
 
         total_commits = 0
         total_additions = 0
@@ -608,6 +1027,7 @@ class GitHubLanguageAnalyzer:
         total_repositories = 0
         repository_details = []
         yearly_stats = defaultdict(lambda: defaultdict(int))
+        color_fallback = self.language_colors.get
 
         for repo_contribution in commit_contributions:
             repo = repo_contribution["repository"]
@@ -622,66 +1042,78 @@ class GitHubLanguageAnalyzer:
             if not include_private and repo["isPrivate"]:
                 continue
 
-            # Count commits for this repository
-            repo_commits = sum(contrib["commitCount"] for contrib in contributions_list)
+            # Commits for this repository, per year and in total
+            commits_per_year = Counter()
+            for contrib in contributions_list:
+                commits_per_year[contrib["occurredAt"][:4]] += contrib["commitCount"]
+            repo_commits = sum(commits_per_year.values())
 
-            if repo_commits < min_commits:
+            # A repository without commits adds nothing but zero-weighted entries
+            if repo_commits == 0 or repo_commits < min_commits:
                 continue
 
+            repo_name = repo["nameWithOwner"]
+            repo_additions = line_stats.get("total_additions", 0)
+            repo_deletions = line_stats.get("total_deletions", 0)
+            repo_net_lines = line_stats.get("net_lines", 0)
+
             total_repositories += 1
             total_commits += repo_commits
-            total_additions += line_stats.get("total_additions", 0)
-            total_deletions += line_stats.get("total_deletions", 0)
+            total_additions += repo_additions
+            total_deletions += repo_deletions
 
             # Track yearly contributions
-            for contrib in contributions_list:
-                year = contrib["occurredAt"][:4]
-                yearly_stats[year]["total_commits"] += contrib["commitCount"]
+            for year, year_commits in commits_per_year.items():
+                yearly_stats[year]["total_commits"] += year_commits
 
             # Primary language
             primary_language = repo["primaryLanguage"]
             if primary_language:
                 lang_name = primary_language["name"]
                 # Use GitHub's color if available, otherwise use our fallback
-                lang_color = primary_language.get("color") or self.language_colors.get(lang_name, "#858585")
+                lang_color = primary_language.get("color") or color_fallback(lang_name, "#858585")
 
-                language_stats[lang_name]["total_commits"] += repo_commits
-                language_stats[lang_name]["repositories"].add(repo["nameWithOwner"])
-                language_stats[lang_name]["color"] = lang_color
+                stats = language_stats[lang_name]
+                stats.total_commits += repo_commits
+                stats.repositories.add(repo_name)
+                stats.color = lang_color
 
                 # Add line stats to primary language
-                language_stats[lang_name]["total_additions"] += line_stats.get("total_additions", 0)
-                language_stats[lang_name]["total_deletions"] += line_stats.get("total_deletions", 0)
-                language_stats[lang_name]["net_lines"] += line_stats.get("net_lines", 0)
+                stats.total_additions += repo_additions
+                stats.total_deletions += repo_deletions
+                stats.net_lines += repo_net_lines
 
             # All languages in the repository with weighted calculations
             repo_languages = []
             total_repo_size = repo["languages"]["totalSize"]
+            covered_percentage = 0
 
+            # Edges come largest first; stop once the remaining tail is under half a percent
             for lang_edge in repo["languages"]["edges"]:
                 lang_name = lang_edge["node"]["name"]
                 lang_size = lang_edge["size"]
                 # Use GitHub's color if available, otherwise use our fallback
-                lang_color = lang_edge["node"].get("color") or self.language_colors.get(lang_name, "#858585")
+                lang_color = lang_edge["node"].get("color") or color_fallback(lang_name, "#858585")
 
                 # Weight commits by language percentage in repository
                 lang_percentage = lang_size / total_repo_size if total_repo_size > 0 else 0
                 weighted_commits = repo_commits * lang_percentage
-                weighted_additions = line_stats.get("total_additions", 0) * lang_percentage
-                weighted_deletions = line_stats.get("total_deletions", 0) * lang_percentage
-                weighted_net = line_stats.get("net_lines", 0) * lang_percentage
-
-                language_stats[lang_name]["weighted_commits"] += weighted_commits
-                language_stats[lang_name]["repositories"].add(repo["nameWithOwner"])
-                language_stats[lang_name]["total_bytes"] += lang_size
-                language_stats[lang_name]["total_additions"] += weighted_additions
-                language_stats[lang_name]["total_deletions"] += weighted_deletions
-                language_stats[lang_name]["net_lines"] += weighted_net
-                language_stats[lang_name]["color"] = lang_color
+                weighted_additions = repo_additions * lang_percentage
+                weighted_deletions = repo_deletions * lang_percentage
+                weighted_net = repo_net_lines * lang_percentage
+
+                stats = language_stats[lang_name]
+                stats.weighted_commits += weighted_commits
+                stats.repositories.add(repo_name)
+                stats.total_bytes += lang_size
+                stats.total_additions += weighted_additions
+                stats.total_deletions += weighted_deletions
+                stats.net_lines += weighted_net
+                stats.color = lang_color
 
                 # Track repository details for this language
-                language_stats[lang_name]["repo_details"].append({
-                    "repo": repo["nameWithOwner"],
+                stats.repo_details.append({
+                    "repo": repo_name,
                     "commits": repo_commits,
                     "percentage": lang_percentage * 100,
                     "bytes": lang_size,
@@ -698,16 +1130,19 @@ class GitHubLanguageAnalyzer:
                 })
 
                 # Track yearly language stats
-                for contrib in contributions_list:
-                    year = contrib["occurredAt"][:4]
-                    yearly_stats[year][lang_name] += contrib["commitCount"] * lang_percentage
+                for year, year_commits in commits_per_year.items():
+                    yearly_stats[year][lang_name] += year_commits * lang_percentage
+
+                covered_percentage += lang_percentage
+                if covered_percentage > 0.995:
+                    break
 
             repository_details.append({
-                "name": repo["nameWithOwner"],
+                "name": repo_name,
                 "commits": repo_commits,
-                "additions": line_stats.get("total_additions", 0),
-                "deletions": line_stats.get("total_deletions", 0),
-                "net_lines": line_stats.get("net_lines", 0),
+                "additions": repo_additions,
+                "deletions": repo_deletions,
+                "net_lines": repo_net_lines,
                 "primary_language": primary_language["name"] if primary_language else "Unknown",
                 "all_languages": repo_languages,
                 "is_fork": repo["isFork"],
@@ -720,19 +1155,19 @@ class GitHubLanguageAnalyzer:
         final_stats = {}
         for lang, stats in language_stats.items():
             final_stats[lang] = {
-                "total_commits": int(stats["total_commits"]),
-                "weighted_commits": stats["weighted_commits"],
-                "commit_percentage": (stats["total_commits"] / total_commits * 100) if total_commits > 0 else 0,
-                "weighted_percentage": (stats["weighted_commits"] / total_commits * 100) if total_commits > 0 else 0,
-                "repository_count": len(stats["repositories"]),
-                "repositories": list(stats["repositories"]),
-                "total_bytes": stats["total_bytes"],
-                "total_additions": int(stats["total_additions"]),
-                "total_deletions": int(stats["total_deletions"]),
-                "net_lines": int(stats["net_lines"]),
-                "lines_percentage": (stats["total_additions"] / total_additions * 100) if total_additions > 0 else 0,
-                "color": stats["color"],
-                "repo_details": stats["repo_details"]
+                "total_commits": int(stats.total_commits),
+                "weighted_commits": stats.weighted_commits,
+                "commit_percentage": (stats.total_commits / total_commits * 100) if total_commits > 0 else 0,
+                "weighted_percentage": (stats.weighted_commits / total_commits * 100) if total_commits > 0 else 0,
+                "repository_count": len(stats.repositories),
+                "repositories": list(stats.repositories),
+                "total_bytes": stats.total_bytes,
+                "total_additions": int(stats.total_additions),
+                "total_deletions": int(stats.total_deletions),
+                "net_lines": int(stats.net_lines),
+                "lines_percentage": (stats.total_additions / total_additions * 100) if total_additions > 0 else 0,
+                "color": stats.color,
+                "repo_details": stats.repo_details
             }
 
         # Convert yearly stats to regular dict
@@ -760,7 +1195,7 @@ class GitHubLanguageAnalyzer:
             },
             # Sort by weighted_commits (commit percentage) as requested
             "languages": dict(sorted(final_stats.items(), key=lambda x: x[1]["weighted_commits"], reverse=True)),
-            "repositories": sorted(repository_details, key=lambda x: x["commits"], reverse=True),
+            "repositories": sorted(repository_details, key=itemgetter("commits"), reverse=True),
             "yearly_breakdown": yearly_summary
         }
 
@@ -822,15 +1257,24 @@ class GitHubLanguageAnalyzer:
         user = data["user"]
         repos = user["repositories"]["nodes"]
 
-        # Calculate stats
-        total_stars = sum(repo["stargazerCount"] for repo in repos if not repo["isPrivate"])
-        total_forks = sum(repo["forkCount"] for repo in repos if not repo["isPrivate"])
-        public_repos = len([repo for repo in repos if not repo["isPrivate"] and not repo["isFork"]])
+        # Calculate stats and count primary languages in a single pass
+        total_stars = 0
+        total_forks = 0
+        public_repos = 0
+        language_counts = Counter()
+        for repo in repos:
+            if repo["isPrivate"]:
+                continue
+            total_stars += repo["stargazerCount"]
+            total_forks += repo["forkCount"]
+            if not repo["isFork"]:
+                public_repos += 1
+            primary_language = repo["primaryLanguage"]
+            if primary_language:
+                language_counts[primary_language["name"]] += 1
 
         # Most used language
-        languages = [repo["primaryLanguage"]["name"] for repo in repos
-                     if repo["primaryLanguage"] and not repo["isPrivate"]]
-        most_used_lang = Counter(languages).most_common(1)[0][0] if languages else "N/A"
+        most_used_lang = language_counts.most_common(1)[0][0] if language_counts else "N/A"
 
         return {
             "login": user["login"],
@@ -869,259 +1313,182 @@ class GitHubLanguageAnalyzer:
         Returns:
             str: Path to the generated SVG file
         """
-        languages = analysis["languages"]
-        summary = analysis["summary"]
+        lines = self._build_terminal_lines(analysis, user_stats, max_languages)
+        theme = TERMINAL_THEMES["dark" if dark_mode else "light"]
+        return self._render_terminal_svg(lines, user_stats, theme, filename)
 
-        # Get top languages
-        top_languages = list(languages.items())[:max_languages]
-
-        # Terminal dimensions
-        width = 800
-        terminal_height = 600
-
-        # Color schemes
-        if dark_mode:
-            bg_color = "#0d1117"
-            terminal_bg = "#161b22"
-            border_color = "#30363d"
-            text_color = "#e6edf3"
-            prompt_color = "#7c3aed"
-            cursor_color = "#f0f6fc"
-            green_color = "#2ea043"
-            red_color = "#da3633"
-            yellow_color = "#fb8500"
-            blue_color = "#2f81f7"
-            gray_color = "#8b949e"
-        else:
-            bg_color = "#ffffff"
-            terminal_bg = "#f6f8fa"
-            border_color = "#d0d7de"
-            text_color = "#24292f"
-            prompt_color = "#8250df"
-            cursor_color = "#24292f"
-            green_color = "#1f883d"
-            red_color = "#cf222e"
-            yellow_color = "#d1242f"
-            blue_color = "#0969da"
-            gray_color = "#656d76"
-
-        # Create SVG root
-        svg = ET.Element("svg", {
-            "width": str(width),
-            "height": str(terminal_height),
-            "xmlns": "http://www.w3.org/2000/svg",
-            "style": "background-color: transparent;"
-        })
-
-        # Background
-        bg_rect = ET.SubElement(svg, "rect", {
-            "width": str(width),
-            "height": str(terminal_height),
-            "fill": bg_color,
-            "rx": "6"
-        })
+    def _build_terminal_lines(self, analysis: dict, user_stats: dict,
+                              max_languages: int = 10) -> List[Tuple[str, str, bool, Optional[str]]]:
+        """
+        Lay out the rows of the terminal SVG independently of the color theme.
 
-        # Terminal window
-        terminal_rect = ET.SubElement(svg, "rect", {
-            "x": "20",
-            "y": "20",
-            "width": str(width - 40),
-            "height": str(terminal_height - 40),
-            "fill": terminal_bg,
-            "stroke": border_color,
-            "stroke-width": "1",
-            "rx": "6"
-        })
+        Args:
+            analysis (dict): Analysis results from analyze_languages
+            user_stats (dict): Basic user statistics
+            max_languages (int): Maximum number of languages to display
 
-        # Terminal header (title bar)
-        header_rect = ET.SubElement(svg, "rect", {
-            "x": "20",
-            "y": "20",
-            "width": str(width - 40),
-            "height": "30",
-            "fill": border_color if dark_mode else "#e1e4e8",
-            "rx": "6 6 0 0"
-        })
+        Returns:
+            List[Tuple[str, str, bool, Optional[str]]]: (XML-escaped text, color role, bold, dot color)
+                per row, the last row being the prompt line
+        """
+        languages = analysis["languages"]
+        summary = analysis["summary"]
 
-        # Terminal buttons (red, yellow, green)
-        button_colors = ["#ff5f56", "#ffbd2e", "#27ca3f"]
-        for i, color in enumerate(button_colors):
-            ET.SubElement(svg, "circle", {
-                "cx": str(35 + i * 15),
-                "cy": "35",
-                "r": "4",
-                "fill": color
-            })
+        # Get top languages; analyze_languages already orders them by weighted commits
+        top_languages = itertools.islice(languages.items(), max_languages)
 
-        # Terminal title
-        title_text = ET.SubElement(svg, "text", {
-            "x": str(width // 2),
-            "y": "40",
-            "font-family": "SF Mono, Monaco, Inconsolata, Roboto Mono, monospace",
-            "font-size": "12",
-            "fill": text_color,
-            "text-anchor": "middle",
-            "font-weight": "500"
-        })
-        title_text.text = f"{user_stats['login']}@github:~$ github-stats"
+        lines = []
 
-        # Content area starts
-        content_y = 70
-        line_height = 14
-        current_y = content_y
+        def add_terminal_line(text: str, role: str = "text", bold: bool = False, dot: Optional[str] = None):
+            lines.append((text, role, bold, dot))
 
-        def add_terminal_line(text: str, color: str = text_color, indent: int = 0, bold: bool = False):
-            nonlocal current_y
-            line_text = ET.SubElement(svg, "text", {
-                "x": str(40 + indent * 8),
-                "y": str(current_y),
-                "font-family": "SF Mono, Monaco, Inconsolata, Roboto Mono, monospace",
-                "font-size": "11",
-                "fill": color,
-                "font-weight": "600" if bold else "400"
-            })
-            line_text.text = text
-            current_y += line_height
+        def add_boxed_line(text: str, role: str = "text", dot: Optional[str] = None, user_text: bool = False):
+            # Pad to 65 characters and add closing border in a single format
+            row = f"{text:<65}│"
+            # Only rows with free-form user or API text can contain XML markup characters
+            add_terminal_line(_xml_escape(row) if user_text else row, role, dot=dot)
 
         # GitHub Stats header
-        add_terminal_line("┌─ GitHub Stats ──────────────────────────────────────────────────┐", border_color,
-                          bold=True)
-        add_terminal_line("│                                                                 │", border_color)
+        add_terminal_line(_BOX_TOP, "border", bold=True)
+        add_terminal_line(_BLANK_LINE, "border")
 
         # User info
-        join_date = datetime.fromisoformat(user_stats['created_at'].replace('Z', '+00:00')).strftime('%Y')
-        user_line = f"│  👤 {user_stats['name']} (@{user_stats['login']}) - Joined {join_date}"
-        # Pad to 65 characters and add closing border
-        user_line = user_line.ljust(65) + "│"
-        add_terminal_line(user_line, text_color)
+        join_year = self._parse_iso_date(user_stats['created_at']).year
+        user_line = f"│  👤 {user_stats['name']} (@{user_stats['login']}) - Joined {join_year}"
+        add_boxed_line(user_line, user_text=True)
 
         if user_stats['bio']:
             bio_text = user_stats['bio'][:50]
             if len(user_stats['bio']) > 50:
                 bio_text += "..."
             bio_line = f"│  📝 {bio_text}"
-            bio_line = bio_line.ljust(65) + "│"
-            add_terminal_line(bio_line, gray_color)
+            add_boxed_line(bio_line, "gray", user_text=True)
 
         if user_stats['location']:
             location_line = f"│  📍 {user_stats['location'][:50]}"
-            location_line = location_line.ljust(65) + "│"
-            add_terminal_line(location_line, gray_color)
+            add_boxed_line(location_line, "gray", user_text=True)
 
-        add_terminal_line("│                                                                 │", border_color)
+        add_terminal_line(_BLANK_LINE, "border")
 
         # Stats section
-        add_terminal_line("│  📊 Repository Stats:                                           │", blue_color, bold=True)
+        add_terminal_line("│  📊 Repository Stats:                                           │", "blue", bold=True)
 
         # Format stats with proper spacing
-        repos_str = str(user_stats['public_repos'])
-        stars_str = str(user_stats['total_stars'])
-        forks_str = str(user_stats['total_forks'])
-        stats_line1 = f"│     Public Repos: {repos_str} │ Total Stars: {stars_str} │ Forks: {forks_str}"
-        stats_line1 = stats_line1.ljust(65) + "│"
-        add_terminal_line(stats_line1, text_color)
+        stats_line1 = (f"│     Public Repos: {user_stats['public_repos']} │ "
+                       f"Total Stars: {user_stats['total_stars']} │ Forks: {user_stats['total_forks']}")
+        add_boxed_line(stats_line1)
 
-        followers_str = str(user_stats['followers'])
-        following_str = str(user_stats['following'])
-        stats_line2 = f"│     Followers: {followers_str} │ Following: {following_str}"
-        stats_line2 = stats_line2.ljust(65) + "│"
-        add_terminal_line(stats_line2, text_color)
+        stats_line2 = f"│     Followers: {user_stats['followers']} │ Following: {user_stats['following']}"
+        add_boxed_line(stats_line2)
 
-        add_terminal_line("│                                                                 │", border_color)
+        add_terminal_line(_BLANK_LINE, "border")
 
         # Contributions
-        add_terminal_line("│  🚀 Contribution Stats:                                        │", green_color, bold=True)
+        add_terminal_line("│  🚀 Contribution Stats:                                        │", "green", bold=True)
 
-        commits_str = str(summary['total_commits'])
-        issues_str = str(user_stats['total_issues'])
-        prs_str = str(user_stats['total_prs'])
-        contrib_line1 = f"│     Commits: {commits_str} │ Issues: {issues_str} │ PRs: {prs_str}"
-        contrib_line1 = contrib_line1.ljust(65) + "│"
-        add_terminal_line(contrib_line1, text_color)
+        contrib_line1 = (f"│     Commits: {summary['total_commits']} │ "
+                         f"Issues: {user_stats['total_issues']} │ PRs: {user_stats['total_prs']}")
+        add_boxed_line(contrib_line1)
 
-        reviews_str = str(user_stats['total_reviews'])
-        repos_analyzed_str = str(summary['total_repositories'])
-        contrib_line2 = f"│     Reviews: {reviews_str} │ Repositories: {repos_analyzed_str}"
-        contrib_line2 = contrib_line2.ljust(65) + "│"
-        add_terminal_line(contrib_line2, text_color)
+        contrib_line2 = (f"│     Reviews: {user_stats['total_reviews']} │ "
+                         f"Repositories: {summary['total_repositories']}")
+        add_boxed_line(contrib_line2)
 
-        add_terminal_line("│                                                                 │", border_color)
+        add_terminal_line(_BLANK_LINE, "border")
 
         # Language analysis header
-        add_terminal_line("│  💻 Language Analysis (by commit percentage):                  │", yellow_color, bold=True)
-        add_terminal_line("│  ═══════════════════════════════════════════════════════════   │", border_color)
+        add_terminal_line("│  💻 Language Analysis (by commit percentage):                  │", "yellow", bold=True)
+        add_terminal_line(_BOX_RULE, "border")
 
         # Language statistics
         for i, (lang, stats) in enumerate(top_languages):
             if i >= max_languages:
                 break
 
-            # Create color indicator
-            lang_color = stats["color"] or "#858585"
-            commits_formatted = f"{int(stats['weighted_commits']):,}"
-            percentage = f"{stats['weighted_percentage']:.1f}%"
-
-            # Language line with proper formatting
-            lang_line = f"│  ● {lang} {commits_formatted} commits ({percentage})"
-            lang_line = lang_line.ljust(65) + "│"
-            add_terminal_line(lang_line, text_color)
-
-            # Add colored dot separately (overwrite the bullet)
-            dot = ET.SubElement(svg, "circle", {
-                "cx": "45",
-                "cy": str(current_y - line_height + 4),
-                "r": "3",
-                "fill": lang_color
-            })
+            # Language line with proper formatting, with a colored dot drawn over the bullet
+            lang_line = (f"│  ● {lang} {int(stats['weighted_commits']):,} commits "
+                         f"({stats['weighted_percentage']:.1f}%)")
+            add_boxed_line(lang_line, dot=stats["color"] or "#858585", user_text=True)
 
         # Line counts if available
         if summary['total_additions'] > 0:
-            add_terminal_line("│                                                                 │", border_color)
-            add_terminal_line("│  📈 Code Statistics:                                           │", blue_color,
-                              bold=True)
+            add_terminal_line(_BLANK_LINE, "border")
+            add_terminal_line("│  📈 Code Statistics:                                           │", "blue", bold=True)
 
-            additions_str = f"{summary['total_additions']:,}"
-            deletions_str = f"{summary['total_deletions']:,}"
-            lines_line1 = f"│     Lines Added: {additions_str} │ Deleted: {deletions_str}"
-            lines_line1 = lines_line1.ljust(65) + "│"
-            add_terminal_line(lines_line1, text_color)
+            lines_line1 = f"│     Lines Added: {summary['total_additions']:,} │ Deleted: {summary['total_deletions']:,}"
+            add_boxed_line(lines_line1)
 
-            net_change_str = f"{summary['net_lines']:+,}"
-            lines_line2 = f"│     Net Change: {net_change_str} lines"
-            lines_line2 = lines_line2.ljust(65) + "│"
-            add_terminal_line(lines_line2, green_color if summary['net_lines'] >= 0 else red_color)
+            lines_line2 = f"│     Net Change: {summary['net_lines']:+,} lines"
+            add_boxed_line(lines_line2, "green" if summary['net_lines'] >= 0 else "red")
 
-        add_terminal_line("│                                                                 │", border_color)
-        add_terminal_line("└─────────────────────────────────────────────────────────────────┘", border_color,
-                          bold=True)
+        add_terminal_line(_BLANK_LINE, "border")
+        add_terminal_line(_BOX_BOTTOM, "border", bold=True)
 
         # Prompt line
         current_time = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
         prompt_line = f"{user_stats['login']}@github:~$ # Generated on {current_time}"
-        add_terminal_line(prompt_line, prompt_color)
-
-        # Blinking cursor
-        cursor_x = 40 + len(prompt_line) * 6
-        cursor = ET.SubElement(svg, "rect", {
-            "x": str(cursor_x),
-            "y": str(current_y - 12),
-            "width": "8",
-            "height": "12",
-            "fill": cursor_color
-        })
+        add_terminal_line(prompt_line, "prompt")
 
-        # Add blinking animation
-        blink_animate = ET.SubElement(cursor, "animate", {
-            "attributeName": "opacity",
-            "values": "1;0;1",
-            "dur": "1.5s",
-            "repeatCount": "indefinite"
-        })
+        return lines
+
+    def _render_terminal_svg(self, lines: List[Tuple[str, str, bool, Optional[str]]], user_stats: dict,
+                             theme: dict, filename: str) -> str:
+        """
+        Render rows laid out by _build_terminal_lines with a color theme and write the SVG.
+
+        Args:
+            lines (List[Tuple[str, str, bool, Optional[str]]]): Rows from _build_terminal_lines
+            user_stats (dict): Basic user statistics
+            theme (dict): One of TERMINAL_THEMES
+            filename (str): Output filename for the SVG
+
+        Returns:
+            str: Path to the generated SVG file
+        """
+        # Terminal dimensions
+        width = 800
+        terminal_height = 600
+
+        parts = [_SVG_HEADER.format(
+            width=width,
+            height=terminal_height,
+            inner_width=width - 40,
+            inner_height=terminal_height - 40,
+            bg_color=theme["bg"],
+            terminal_bg=theme["terminal_bg"],
+            border_color=theme["border"],
+            header_color=theme["header"],
+            title_x=width // 2,
+            text_color=theme["text"],
+            title=f"{user_stats['login']}@github:~$ github-stats"
+        )]
+
+        # Content area starts
+        content_y = 70
+        line_height = 14
+        current_y = content_y
+
+        # Bound once, the row loop does no attribute lookups
+        append = parts.append
+        format_row = _ROW_TEMPLATE.format
+        format_dot = _DOT_TEMPLATE.format
+
+        for text, role, bold, dot in lines:
+            append(format_row(x=40, y=current_y, fill=theme[role], weight="600" if bold else "400", text=text))
+            if dot:
+                append(format_dot(cy=current_y + 4, fill=dot))
+            current_y += line_height
+
+        # Blinking cursor after the prompt line
+        parts.append(_SVG_FOOTER.format(
+            cursor_x=40 + len(lines[-1][0]) * 6,
+            cursor_y=current_y - 12,
+            cursor_color=theme["cursor"]
+        ))
 
         # Write SVG to file
-        tree = ET.ElementTree(svg)
-        ET.indent(tree, space="  ", level=0)
-        tree.write(filename, encoding="utf-8", xml_declaration=True)
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write("".join(parts))
 
         return filename
 
@@ -1140,31 +1507,34 @@ class GitHubLanguageAnalyzer:
         languages = analysis["languages"]
         yearly_breakdown = analysis.get("yearly_breakdown", {})
 
-        print(f"\n🔍 Multi-Year Language Analysis with Line Counts for {user['name']} (@{user['login']})")
-        print("=" * 125)
-        print(f"📅 Period: {period['from'][:10]} to {period['to'][:10]} ({summary['years_analyzed']} years)")
-        print(f"📊 Total Commits: {summary['total_commits']:,}")
-        print(f"📚 Total Repositories: {summary['total_repositories']}")
-        print(f"➕ Total Lines Added: {summary['total_additions']:,}")
-        print(f"➖ Total Lines Deleted: {summary['total_deletions']:,}")
-        print(f"📈 Net Lines: {summary['net_lines']:,}")
+        # Collect the report and write it to stdout at once
+        out = []
+        out.append(f"\n🔍 Multi-Year Language Analysis with Line Counts for {user['name']} (@{user['login']})")
+        out.append("=" * 125)
+        out.append(f"📅 Period: {period['from'][:10]} to {period['to'][:10]} ({summary['years_analyzed']} years)")
+        out.append(f"📊 Total Commits: {summary['total_commits']:,}")
+        out.append(f"📚 Total Repositories: {summary['total_repositories']}")
+        out.append(f"➕ Total Lines Added: {summary['total_additions']:,}")
+        out.append(f"➖ Total Lines Deleted: {summary['total_deletions']:,}")
+        out.append(f"📈 Net Lines: {summary['net_lines']:,}")
 
         if not languages:
-            print("\n❌ No language data found for the specified period.")
+            out.append("\n❌ No language data found for the specified period.")
+            sys.stdout.write("\n".join(out) + "\n")
             return
 
-        print(f"\n🏆 Top {min(top_n, len(languages))} Languages by Commit Percentage:")
-        print("=" * 125)
-        print(
+        out.append(f"\n🏆 Top {min(top_n, len(languages))} Languages by Commit Percentage:")
+        out.append("=" * 125)
+        out.append(
             f"{'Rank':<5} {'Language':<20} {'Weighted':<12} {'Commit%':<10} {'Lines+':<12} {'Lines-':<12} {'Net':<12} {'Repos':<7} {'Bytes':<10}")
-        print(f"{'':5} {'':20} {'Commits':<12} {'':10} {'':12} {'':12} {'':12} {'':7} {'':10}")
-        print("=" * 125)
+        out.append(f"{'':5} {'':20} {'Commits':<12} {'':10} {'':12} {'':12} {'':12} {'':7} {'':10}")
+        out.append("=" * 125)
 
-        for i, (lang, stats) in enumerate(list(languages.items())[:top_n], 1):
+        for i, (lang, stats) in enumerate(itertools.islice(languages.items(), top_n), 1):
             color_indicator = f"●" if stats["color"] else "○"
             bytes_formatted = self._format_bytes(stats["total_bytes"])
 
-            print(f"{i:2d}. {color_indicator} {lang:<18} "
+            out.append(f"{i:2d}. {color_indicator} {lang:<18} "
                   f"{int(stats['weighted_commits']):>10,} "
                   f"{stats['weighted_percentage']:>8.1f}% "
                   f"{stats['total_additions']:>10,} "
@@ -1174,54 +1544,57 @@ class GitHubLanguageAnalyzer:
                   f"{bytes_formatted:>8}")
 
         # Language distribution chart by commit percentage
-        print(f"\n📈 Language Distribution by Commit Percentage (Top 10):")
-        print("-" * 60)
+        out.append(f"\n📈 Language Distribution by Commit Percentage (Top 10):")
+        out.append("-" * 60)
 
-        max_weighted = max(stats["weighted_commits"] for stats in languages.values()) if languages else 1
+        # Languages are sorted by weighted commits, so the first one holds the maximum
+        max_weighted = next(iter(languages.values()))["weighted_commits"]
 
-        for lang, stats in list(languages.items())[:10]:
+        for lang, stats in itertools.islice(languages.items(), 10):
             bar_length = int((stats["weighted_commits"] / max_weighted) * 40)
-            bar = "█" * bar_length + "░" * (40 - bar_length)
-            print(f"{lang:<15} │{bar}│ {stats['weighted_percentage']:>5.1f}%")
+            bar = _BAR_POOL[40 - bar_length:80 - bar_length]
+            out.append(f"{lang:<15} │{bar}│ {stats['weighted_percentage']:>5.1f}%")
 
         # Yearly breakdown
         if show_yearly and yearly_breakdown:
-            print(f"\n📅 Yearly Contribution Breakdown:")
-            print("-" * 50)
+            out.append(f"\n📅 Yearly Contribution Breakdown:")
+            out.append("-" * 50)
 
             years = sorted(yearly_breakdown.keys())
             for year in years[-5:]:  # Show last 5 years
                 year_data = yearly_breakdown[year]
                 total_year_commits = year_data.get("total_commits", 0)
                 if total_year_commits > 0:
-                    print(f"\n{year}: {total_year_commits:,} commits")
+                    out.append(f"\n{year}: {total_year_commits:,} commits")
 
                     # Top 3 languages for this year
                     year_langs = [(lang, commits) for lang, commits in year_data.items()
                                   if lang != "total_commits" and commits > 0]
-                    year_langs.sort(key=lambda x: x[1], reverse=True)
+                    year_langs.sort(key=itemgetter(1), reverse=True)
 
                     for lang, commits in year_langs[:3]:
                         percentage = (commits / total_year_commits) * 100
-                        print(f"  • {lang}: {commits:.0f} commits ({percentage:.1f}%)")
+                        out.append(f"  • {lang}: {commits:.0f} commits ({percentage:.1f}%)")
 
         # Repository insights with line counts
         top_repos = analysis["repositories"][:5]
         if top_repos:
-            print(f"\n🏢 Top 5 Most Active Repositories by Commits:")
-            print("-" * 80)
+            out.append(f"\n🏢 Top 5 Most Active Repositories by Commits:")
+            out.append("-" * 80)
             for repo in top_repos:
                 fork_indicator = " (fork)" if repo["is_fork"] else ""
                 private_indicator = " (private)" if repo["is_private"] else ""
                 net_lines = repo["additions"] - repo["deletions"]
-                print(f"• {repo['name']}{fork_indicator}{private_indicator}")
-                print(
+                out.append(f"• {repo['name']}{fork_indicator}{private_indicator}")
+                out.append(
                     f"  {repo['commits']:,} commits, +{repo['additions']:,}/-{repo['deletions']:,} lines (net: {net_lines:+,})")
-                print(f"  Primary: {repo['primary_language']}")
+                out.append(f"  Primary: {repo['primary_language']}")
+
+        sys.stdout.write("\n".join(out) + "\n")
 
     def _format_bytes(self, bytes_count: int) -> str:
         """Format bytes in human readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
+        for unit in ('B', 'KB', 'MB', 'GB'):
             if bytes_count < 1024.0:
                 return f"{bytes_count:.1f}{unit}"
             bytes_count /= 1024.0
@@ -1235,11 +1608,9 @@ class GitHubLanguageAnalyzer:
             analysis (dict): Analysis results
             filename (str): Output filename
         """
-        # Convert sets to lists for JSON serialization
-        json_data = json.loads(json.dumps(analysis, default=str))
-
+        # Non-JSON values are stringified while writing rather than in a separate round trip
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+            json.dump(analysis, f, indent=2, ensure_ascii=False, default=str)
         print(f"\n💾 Enhanced analysis with line counts saved to {filename}")
 
 
@@ -1280,6 +1651,8 @@ Examples:
     parser.add_argument("--no-yearly", action="store_true", help="Skip yearly breakdown display")
     parser.add_argument("--no-line-counts", action="store_true",
                         help="Skip line count analysis (faster execution)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Do not reuse line counts of past date ranges cached on disk")
 
     args = parser.parse_args()
 
@@ -1316,7 +1689,7 @@ Examples:
             return 1
 
     try:
-        analyzer = GitHubLanguageAnalyzer(token)
+        analyzer = GitHubLanguageAnalyzer(token, use_cache=not args.no_cache)
 
         print(f"🔄 Fetching contributions for @{args.username}...")
         if from_date and to_date:
@@ -1353,21 +1726,25 @@ Examples:
         if args.terminal_svg:
             print(f"\n🎨 Generating terminal-style SVG visualization...")
 
-            if not args.dark_only:
-                # Generate light mode
-                light_path = analyzer.generate_terminal_svg(
-                    analysis, user_stats, f"{args.terminal_svg}_light.svg",
-                    dark_mode=False, max_languages=min(args.top_n, 10)
-                )
-                print(f"📊 Light mode SVG saved to {light_path}")
+            # Lay out the rows once; the themes only differ in colors
+            lines = analyzer._build_terminal_lines(analysis, user_stats, max_languages=min(args.top_n, 10))
 
+            themes = []
+            if not args.dark_only:
+                themes.append(("light", "Light"))
             if not args.light_only:
-                # Generate dark mode
-                dark_path = analyzer.generate_terminal_svg(
-                    analysis, user_stats, f"{args.terminal_svg}_dark.svg",
-                    dark_mode=True, max_languages=min(args.top_n, 10)
-                )
-                print(f"📊 Dark mode SVG saved to {dark_path}")
+                themes.append(("dark", "Dark"))
+
+            # The theme files are independent, so write them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(analyzer._render_terminal_svg, lines, user_stats, TERMINAL_THEMES[theme],
+                                    f"{args.terminal_svg}_{theme}.svg")
+                    for theme, _ in themes
+                ]
+
+            for (_, label), future in zip(themes, futures):
+                print(f"📊 {label} mode SVG saved to {future.result()}")
 
     except Exception as e:
         print(f"❌ Error: {e}")